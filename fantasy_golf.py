@@ -1,7 +1,7 @@
 """
 Fantasy Golf League Tracker
 Run with:  uv run streamlit run fantasy_golf.py
-Install:   uv add streamlit pandas requests beautifulsoup4 plotly
+Install:   uv add streamlit pandas requests beautifulsoup4 lxml faust-cchardet orjson requests-cache plotly
 Python:    3.8+
 
 Results storage format per golfer:
@@ -14,13 +14,32 @@ Results storage format per golfer:
 
 import unicodedata
 import streamlit as st
-import json
+import hashlib
+import heapq
+import html
+import itertools
+import logging
+import orjson
 import os
 import re
 import requests
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache, partial
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from urllib3.util.retry import Retry
+
+try:
+    import plotly.graph_objects as go
+    HAS_PLOTLY = True
+except ImportError:  # optional: Standings falls back to a table
+    HAS_PLOTLY = False
+
+log = logging.getLogger(__name__)
 
 DATA_FILE = "fantasy_golf_data.json"
 ESPN_SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/golf/pga/scoreboard"
@@ -34,13 +53,36 @@ STATUS_EMOJI = {
     "not_entered":    "—",
     "unknown_absent": "❓ Review",
 }
+# Result frames hold status as integer codes over this fixed set rather than repeated strings
+STATUS_CATS = pd.CategoricalDtype(list(STATUS_EMOJI))
+
+# Compiled once — these run on every row of every scraped table
+_RE_NONDIGIT = re.compile(r"[^\d]")
+_RE_MONEY_CLEAN = re.compile(r"[^\d.]")
+_RE_POS_NUM = re.compile(r"^T?\d+$")
+_RE_LONG_NUM = re.compile(r"\d{5,}")
+_RE_TR = re.compile(r"<tr\b[^>]*>(.*?)</tr>", re.S | re.I)
+_RE_CELL = re.compile(r"<t[dh]\b[^>]*>(.*?)</t[dh]>", re.S | re.I)
+_RE_CELL_OPEN = re.compile(r"<t[dh]\b", re.I)
+_RE_TR_OPEN = re.compile(r"<tr\b", re.I)
+_RE_TABLE = re.compile(r"<table\b[^>]*>(.*?)</table>", re.S | re.I)
+_RE_TABLE_OPEN = re.compile(r"<table\b", re.I)
+_RE_TAG = re.compile(r"<[^>]+>")
+_RE_H1 = re.compile(r"<h1\b[^>]*>(.*?)</h1>", re.S | re.I)
+_RE_TITLE = re.compile(r"<title\b[^>]*>(.*?)</title>", re.S | re.I)
+_RE_TOURNAMENT_ID = re.compile(r"(R\d{7})", re.I)
+_RE_ND_WD = re.compile(r"\bW\b|WD|WITHDRAW")
+_RE_ND_CUT = re.compile(r"\bC\b|\bMC\b|CUT|MDF|MISSED")
+_RE_PAGE_NAME = re.compile(r"[A-Z][a-z]+(?:\s[A-Z][a-z'\-]+){1,3}")
+_RE_TEXT_WD = re.compile(r"\bWD\b|WITHDREW|WITHDRAWAL")
+_RE_TEXT_CUT = re.compile(r"\bCUT\b|\bMC\b|MISSED CUT")
 
 # ── Data persistence ──────────────────────────────────────────────────────────
 
 def load_data():
     if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, "r") as f:
-            d = json.load(f)
+        with open(DATA_FILE, "rb") as f:
+            d = orjson.loads(f.read())
         if "tournament_order" not in d:
             d["tournament_order"] = list(d.get("tournaments", {}).keys())
         for t in d.get("tournaments", {}):
@@ -49,18 +91,90 @@ def load_data():
         # Ensure payout keys are always integers (JSON converts them to strings)
         if "live_state" in d and "payout" in d["live_state"]:
             d["live_state"]["payout"] = {int(k): v for k, v in d["live_state"]["payout"].items()}
+        normalize_results(d)
         return d
     return {"teams": {}, "tournaments": {}, "tournament_order": {}, "live_state": {"payout": {}, "tourney_name": ""}}
 
+@st.cache_resource
+def get_save_executor():
+    """Single writer thread, so saves land on disk in the order they were made."""
+    tmp = DATA_FILE + ".tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)  # left behind by a process that died mid-write
+    return ThreadPoolExecutor(max_workers=1)
+
+def _write_atomic(payload, path):
+    # Write a temp file and swap it in, so a crash mid-write can't truncate the season
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+@st.cache_resource
+def _version_counter():
+    return itertools.count(1)
+
+def bump_data_version():
+    """Stamp this session's data with a new process-unique version — the cache key for derived views."""
+    st.session_state.data_version = next(_version_counter())
+
+@st.cache_resource
+def _last_saved():
+    """
+    Shared by every session: digest of the payload last written to disk, digest of the newest one
+    handed to the writer, and the last write error.
+    """
+    return {"digest": None, "queued": None, "error": None}
+
+def _save_done(last, digest, future):
+    # Runs on the writer thread; the next page run shows the error (see App setup)
+    err = future.exception()
+    if err is None:
+        last["digest"] = digest
+    else:
+        log.error("Writing %s failed: %s", DATA_FILE, err)
+        last["digest"] = None  # so resubmitting the same payload retries the write
+    last["error"] = err
+
 def save_data(data):
-    with open(DATA_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    # Serialize here (the bytes are the snapshot, later mutations can't race it); disk I/O runs off-thread
+    # Compact on disk; the Setup backup download is the pretty-printed export
+    payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    # Derived views are per session, the file is per process — a no-op resubmit skips both
+    if digest != st.session_state.get("saved_digest"):
+        st.session_state.saved_digest = digest
+        bump_data_version()
+    last = _last_saved()
+    # Skip only when this payload is both the newest queued and already on disk
+    if digest != last["digest"] or digest != last["queued"]:
+        last["queued"] = digest
+        get_save_executor().submit(_write_atomic, payload, DATA_FILE).add_done_callback(partial(_save_done, last, digest))
 
 def save_live_state(data, payout, tourney_name):
     """Persist the live payout to the JSON file so it survives Streamlit restarts."""
     data["live_state"] = {"payout": payout, "tourney_name": tourney_name}
     save_data(data)
 
+def normalize_results(d):
+    """Rewrite legacy bare-number results into full {prize, status} dicts, once at load."""
+    for t_info in d.get("tournaments", {}).values():
+        results = t_info.get("results", {})
+        for g, entry in results.items():
+            if isinstance(entry, dict):
+                entry.setdefault("prize", 0)
+                entry.setdefault("status", "scored")
+            else:
+                results[g] = {"prize": entry, "status": "scored"}
+    return d
+
+# Stand-in for a golfer with no entry in a tournament (same as the old get_prize/get_status defaults)
+NO_RESULT = {"prize": 0, "status": "scored"}
+NOT_ENTERED = {"prize": 0, "status": "not_entered"}
+
+# Compat shims — entries are normalized on load, so app code reads entry["prize"] directly
 def get_prize(entry):
     return entry.get("prize", 0) if isinstance(entry, dict) else entry
 
@@ -69,72 +183,131 @@ def get_status(entry):
 
 # ── Scrapers ──────────────────────────────────────────────────────────────────
 
-def scrape_pga_payout_table(url):
-    resp = requests.get(url, headers=HEADERS, timeout=15)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
-    h1 = soup.find("h1")
-    title_tag = soup.find("title")
-    raw = h1.get_text(strip=True) if h1 else (title_tag.get_text(strip=True) if title_tag else "")
-    tourney_name = raw.split("|")[0].strip()[:80]
-
-    payout_map = {}
-    for table in soup.find_all("table"):
-        rows = table.find_all("tr")
-        if len(rows) < 3:
-            continue
-
-        # Auto-detect position column (col 0) and money column (first col with $ signs)
-        money_col = None
-        for sample_row in rows[1:6]:
-            cells = sample_row.find_all(["td", "th"])
-            for idx, cell in enumerate(cells):
-                txt = cell.get_text(strip=True)
-                if "$" in txt or (re.search(r"\d{5,}", txt) and idx > 0):
-                    money_col = idx
-                    break
-            if money_col is not None:
-                break
-
-        if money_col is None:
-            # Fallback: try column 1 and 2
-            for fallback_col in [1, 2]:
-                for sample_row in rows[1:6]:
-                    cells = sample_row.find_all(["td", "th"])
-                    if fallback_col < len(cells):
-                        txt = re.sub(r"[^\d]", "", cells[fallback_col].get_text(strip=True))
-                        if len(txt) >= 4:
-                            money_col = fallback_col
-                            break
-                if money_col is not None:
-                    break
-
-        if money_col is None:
+@st.cache_resource
+def get_http_session():
+    """
+    One pooled session for every scrape/ESPN call, kept alive across reruns.
+    Responses are also cached on disk (http_cache.sqlite) so re-fetching a published
+    article after a restart is a local read. Live/leaderboard data expires quickly.
+    """
+    import requests_cache  # deferred with bs4: only pages that fetch pay for these imports
+    session = requests_cache.CachedSession(
+        "http_cache", backend="sqlite", allowable_methods=("GET",),
+        expire_after=timedelta(days=30),
+        urls_expire_after={
+            "site.api.espn.com": 30,
+            "*/leaderboard": 600,
+        },
+    )
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                          max_retries=Retry(total=2, backoff_factor=0.3,
+                                            status_forcelist=(429, 500, 502, 503, 504)))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+@lru_cache(maxsize=None)
+def _soup_parts():
+    """BeautifulSoup plus the strainers that limit parsing to what the scrapers read (nav/ads/sidebars skipped)."""
+    from bs4 import BeautifulSoup, SoupStrainer
+    return BeautifulSoup, SoupStrainer(["h1", "title", "table"]), SoupStrainer("script", id="__NEXT_DATA__")
+
+def _fast_text(tag):
+    """tag.get_text(strip=True), skipping the tree walk for the usual single-string cell."""
+    s = tag.string
+    return s.strip() if s is not None else tag.get_text(strip=True)
+
+def _tag_text(fragment):
+    """Stripped, entity-decoded text of an HTML fragment (regex counterpart of get_text(strip=True))."""
+    return "".join(html.unescape(p).strip() for p in _RE_TAG.split(fragment))
+
+def _payout_from_rows(rows):
+    """
+    {position: amount} from one table given as rows of cell text; {} if it has no money column.
+    Position is column 0; money is the first column with a $ (or a 5+ digit number past column 0)
+    in rows 1-5, else column 1 or 2 if it holds 4+ digits. The first amount for a position wins.
+    """
+    money_col = next((idx for cells in rows[1:6] for idx, txt in enumerate(cells)
+                      if "$" in txt or (idx > 0 and _RE_LONG_NUM.search(txt))), None)
+    if money_col is None:
+        money_col = next((col for col in (1, 2) for cells in rows[1:6]
+                          if col < len(cells) and len(_RE_NONDIGIT.sub("", cells[col])) >= 4), None)
+    if money_col is None:
+        return {}
+    payout = {}
+    for cells in rows:
+        if len(cells) <= money_col or cells[0].lower() in ("pos.", "pos", "position", "finish", "#"):
             continue
-
-        for row in rows:
-            cells = row.find_all(["td", "th"])
-            if len(cells) <= money_col:
-                continue
-            pos_text = cells[0].get_text(strip=True)
-            if pos_text.lower() in ("pos.", "pos", "position", "finish", "#"):
-                continue
+        try:
             # Strip T from tied positions like "T5"
-            pos_clean = re.sub(r"[^\d]", "", pos_text)
-            try:
-                pos = int(pos_clean)
-            except ValueError:
-                continue
-            amount_clean = re.sub(r"[^\d.]", "", cells[money_col].get_text(strip=True))
-            try:
-                amount = float(amount_clean)
-            except ValueError:
-                continue
-            if amount > 0 and pos not in payout_map:
-                payout_map[pos] = amount
+            pos = int(_RE_NONDIGIT.sub("", cells[0]))
+            amount = float(_RE_MONEY_CLEAN.sub("", cells[money_col]))
+        except ValueError:
+            continue
+        if amount > 0 and pos not in payout:
+            payout[pos] = amount
+    return payout
 
-        if payout_map:
+def _payout_rows_fast(html_text):
+    """
+    _payout_from_soup over regex-split <table>/<tr>/<td> instead of a DOM: same first-table and
+    column rules. Returns {} (so the caller falls back to bs4) on markup the regexes can't mirror
+    (nested tables, unclosed rows or cells) or unless it reads as a clean purse table
+    (positions 1..N, amounts never rising).
+    """
+    for table in _RE_TABLE.finditer(html_text):
+        body = table.group(1)
+        if _RE_TABLE_OPEN.search(body):
+            return {}
+        trs = _RE_TR.findall(body)
+        if len(trs) != len(_RE_TR_OPEN.findall(body)):
+            return {}
+        rows = []
+        for tr in trs:
+            cells = _RE_CELL.findall(tr)
+            if len(cells) != len(_RE_CELL_OPEN.findall(tr)):
+                return {}
+            rows.append([_tag_text(c) for c in cells])
+        if len(rows) >= 3 and (payout := _payout_from_rows(rows)):
             break
+    else:
+        return {}
+    amounts = list(payout.values())
+    if (len(payout) < 5 or list(payout) != list(range(1, len(payout) + 1))
+            or any(b > a for a, b in zip(amounts, amounts[1:]))):
+        return {}
+    return payout
+
+def _payout_from_soup(soup):
+    """{position: amount} from the first table with a recognisable money column."""
+    for table in soup.find_all("table"):
+        rows = [[_fast_text(c) for c in tr.find_all(["td", "th"])] for tr in table.find_all("tr")]
+        if len(rows) >= 3 and (payout_map := _payout_from_rows(rows)):
+            return payout_map
+    return {}
+
+# Published payout/results articles rarely change, so parsed output is pickled to disk and
+# survives restarts (Streamlit ignores ttl on disk-persisted caches, so there is none).
+# A wrong or early parse is replaced through rescrape(), the admin "Re-scrape" checkboxes.
+@st.cache_data(persist="disk", show_spinner=False)
+def scrape_pga_payout_table(url, _fresh=False):
+    resp = get_http_session().get(url, timeout=15, force_refresh=_fresh)
+    resp.raise_for_status()
+    html_text = resp.content.decode("utf-8", "replace")
+    payout_map = _payout_rows_fast(html_text)
+    if payout_map:
+        title = _RE_H1.search(html_text) or _RE_TITLE.search(html_text)
+        raw = _tag_text(title.group(1)) if title else ""
+    else:
+        # Hand lxml the raw bytes so bs4 sniffs the encoding with cchardet
+        BeautifulSoup, article_parts, _ = _soup_parts()
+        soup = BeautifulSoup(resp.content, "lxml", parse_only=article_parts)
+        h1 = soup.find("h1")
+        title_tag = soup.find("title")
+        raw = h1.get_text(strip=True) if h1 else (title_tag.get_text(strip=True) if title_tag else "")
+        payout_map = _payout_from_soup(soup)
+    tourney_name = raw.split("|")[0].strip()[:80]
 
     if not payout_map:
         raise ValueError(
@@ -144,60 +317,62 @@ def scrape_pga_payout_table(url):
     return payout_map, tourney_name
 
 
-def scrape_pga_results_article(url):
-    resp = requests.get(url, headers=HEADERS, timeout=15)
+@st.cache_data(persist="disk", show_spinner=False)
+def scrape_pga_results_article(url, _fresh=False):
+    resp = get_http_session().get(url, timeout=15, force_refresh=_fresh)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+    BeautifulSoup, article_parts, _ = _soup_parts()
+    soup = BeautifulSoup(resp.content, "lxml", parse_only=article_parts)
     h1 = soup.find("h1")
     title_tag = soup.find("title")
     raw = h1.get_text(strip=True) if h1 else (title_tag.get_text(strip=True) if title_tag else "")
     tourney_name = raw.split("|")[0].strip()[:80]
     players = []
     for table in soup.find_all("table"):
-        headers_t = [th.get_text(strip=True).lower() for th in table.find_all("th")]
+        rows_t = table.find_all("tr")
+        headers_t = [_fast_text(th).lower() for th in table.find_all("th")]
         has_name = any(h in ("player", "name", "golfer") for h in headers_t)
         has_money = any(h in ("money", "prize", "earnings", "amount", "prize money") for h in headers_t)
         if not (has_name or has_money):
-            rows_t = table.find_all("tr")
-            sample = " ".join(td.get_text() for r in rows_t[:5] for td in r.find_all("td"))
+            sample = " ".join(td.get_text() for r in rows_t[:5] for td in r.find_all("td", recursive=False))
             if "$" not in sample:
                 continue
-        rows_t = table.find_all("tr")
         if len(rows_t) < 3:
             continue
-        header_row = rows_t[0].find_all(["th", "td"])
-        ht = [c.get_text(strip=True).lower() for c in header_row]
+        # Cells are always direct children of their <tr>; don't descend into nested markup
+        ht = [_fast_text(c).lower() for c in rows_t[0].find_all(["th", "td"], recursive=False)]
         pos_idx = next((i for i, h in enumerate(ht) if h in ("pos", "pos.", "position", "place", "fin", "finish")), None)
         name_idx = next((i for i, h in enumerate(ht) if h in ("player", "name", "golfer", "athlete")), None)
         money_idx = next((i for i, h in enumerate(ht) if h in ("money", "prize", "earnings", "amount", "prize money", "winnings", "purse")), None)
         if pos_idx is None and name_idx is None:
             for sr in rows_t[1:4]:
-                cells = sr.find_all("td")
+                cells = sr.find_all("td", recursive=False)
                 if len(cells) >= 3:
-                    first = cells[0].get_text(strip=True)
-                    last = cells[-1].get_text(strip=True)
-                    if re.match(r"^T?\d+$", first) and "$" in last:
+                    first = _fast_text(cells[0])
+                    last = _fast_text(cells[-1])
+                    if _RE_POS_NUM.match(first) and "$" in last:
                         pos_idx, name_idx, money_idx = 0, 1, len(cells) - 1
                         break
         if name_idx is None or money_idx is None:
             continue
+        max_idx = max(i for i in (pos_idx, name_idx, money_idx) if i is not None)
         for row in rows_t[1:]:
-            cells = row.find_all(["td", "th"])
-            if len(cells) <= max(filter(lambda x: x is not None, [pos_idx, name_idx, money_idx])):
+            cells = row.find_all(["td", "th"], recursive=False)
+            if len(cells) <= max_idx:
                 continue
-            name = cells[name_idx].get_text(strip=True) if name_idx < len(cells) else ""
+            name = _fast_text(cells[name_idx]) if name_idx < len(cells) else ""
             if not name or name.lower() in ("player", "name", "golfer"):
                 continue
-            money_clean = re.sub(r"[^\d.]", "", cells[money_idx].get_text(strip=True) if money_idx < len(cells) else "0")
+            money_clean = _RE_MONEY_CLEAN.sub("", _fast_text(cells[money_idx]) if money_idx < len(cells) else "0")
             try:
                 prize = float(money_clean)
             except ValueError:
                 prize = 0.0
             pos_display, pos_int = "", 999
             if pos_idx is not None and pos_idx < len(cells):
-                pos_display = cells[pos_idx].get_text(strip=True)
+                pos_display = _fast_text(cells[pos_idx])
                 try:
-                    pos_int = int(re.sub(r"[^\d]", "", pos_display))
+                    pos_int = int(_RE_NONDIGIT.sub("", pos_display))
                 except ValueError:
                     pass
             pd_lower = pos_display.lower()
@@ -216,6 +391,35 @@ def scrape_pga_results_article(url):
         raise ValueError("Could not find a player results table. Use a 'Points and Payouts' article URL.")
     return players, tourney_name
 
+def _result_or_error(fn, *args):
+    try:
+        return fn(*args)
+    except Exception as e:
+        return e
+
+def rescrape(scraper, url, fresh=True):
+    """scraper(url); with fresh, its cached parse is dropped first and the page re-fetched past the HTTP cache."""
+    if not fresh:
+        return scraper(url)
+    scraper.clear(url)
+    return scraper(url, _fresh=True)
+
+def _script_pool(max_workers):
+    """Thread pool whose workers carry the calling run's ScriptRunContext, for st.cache_data calls inside them."""
+    return ThreadPoolExecutor(max_workers=max_workers, initializer=add_script_run_ctx,
+                              initargs=(None, get_script_run_ctx()))
+
+def article_payout(players):
+    """position → prize from a scraped results article, leaving out unplaced (999) rows."""
+    return {p["position"]: p["prize"] for p in players if p["prize"] > 0 and p["position"] != 999}
+
+def scrape_many(urls, max_workers=8):
+    """scrape_pga_results_article for several URLs at once: [(url, (players, name) or the exception)], in input order."""
+    if not urls:
+        return []
+    with _script_pool(min(max_workers, len(urls))) as pool:
+        return list(zip(urls, pool.map(_result_or_error, [scrape_pga_results_article] * len(urls), urls)))
+
 
 def _extract_tournament_id(url: str) -> str:
     """
@@ -224,13 +428,15 @@ def _extract_tournament_id(url: str) -> str:
          .../r/R2026002/... -> "R2026002"
     """
     # Match R followed by 7 digits (standard PGA Tour event ID format)
-    m = re.search(r'(R\d{7})', url, re.IGNORECASE)
+    m = _RE_TOURNAMENT_ID.search(url)
     if m:
         return m.group(1).upper()
     return ""
 
 
-def scrape_pga_leaderboard_status(url: str):
+# Statuses only move at the cut or on a WD, so repeat Auto-classify clicks reuse one scrape
+@st.cache_data(ttl=600, show_spinner=False, max_entries=32)
+def scrape_pga_leaderboard_status(url: str, _fresh=False):
     """
     Get player statuses (cut / wd / active / not_entered) from a PGA Tour leaderboard.
 
@@ -242,7 +448,8 @@ def scrape_pga_leaderboard_status(url: str):
     4. Raw HTML text search for WD/CUT near player names
 
     Returns dict: {player_name: "cut"|"wd"|"active"}
-    Players NOT in dict = not entered (DNP).
+    Players NOT in dict = not entered (DNP). Raises ValueError if no statuses are found.
+    _fresh (not part of the cache key) skips the HTTP cache for every request made.
     """
     status_map = {}
 
@@ -258,10 +465,10 @@ def scrape_pga_leaderboard_status(url: str):
 
     for api_url in api_urls:
         try:
-            r = requests.get(api_url, headers=HEADERS, timeout=12)
+            r = get_http_session().get(api_url, timeout=12, force_refresh=_fresh)
             if r.status_code != 200:
                 continue
-            lb_data = r.json()
+            lb_data = orjson.loads(r.content)
 
             # Walk the JSON looking for player rows
             # PGA Tour format: rootNodes[n].rows[m].players[k] or leaderboardRows[n].players[k]
@@ -313,23 +520,27 @@ def scrape_pga_leaderboard_status(url: str):
 
     # ── Attempt 3: HTML page scraping ─────────────────────────────────────
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        resp = get_http_session().get(url, timeout=15, force_refresh=_fresh)
         resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        BeautifulSoup, _, next_data_part = _soup_parts()
+        soup = BeautifulSoup(resp.content, "lxml", parse_only=next_data_part)
         page_text = resp.text
 
         # 3a: __NEXT_DATA__ JSON blob
         nd = soup.find("script", {"id": "__NEXT_DATA__"})
         if nd and nd.string:
             try:
-                next_data = json.loads(nd.string)
+                next_data = orjson.loads(str(nd.string))  # orjson rejects str subclasses like NavigableString
 
-                def find_players_nd(obj, depth=0):
+                # Explicit pre-order stack (children pushed reversed) so nodes are visited
+                # in document order without a Python frame per node
+                stack = [(next_data, 0)]
+                while stack:
+                    obj, depth = stack.pop()
                     if depth > 15 or not obj:
-                        return
+                        continue
                     if isinstance(obj, list):
-                        for item in obj:
-                            find_players_nd(item, depth + 1)
+                        stack.extend((item, depth + 1) for item in reversed(obj))
                     elif isinstance(obj, dict):
                         # Collect name candidates
                         first = obj.get("firstName", "")
@@ -361,22 +572,19 @@ def scrape_pga_leaderboard_status(url: str):
                         if full:
                             if any(x in combined for x in ("W", "WD", "WITHDRAW", "WITHDREW")):
                                 # Make sure it's not just "W" matching a word
-                                if re.search(r'\bW\b|WD|WITHDRAW', combined):
+                                if _RE_ND_WD.search(combined):
                                     status_map[full] = "wd"
                             if any(x in combined for x in ("DQ", "DISQ")):
                                 status_map[full] = "wd"
                             elif any(x in combined for x in ("C", "CUT", "MC", "MDF", "MISSED")):
-                                if re.search(r'\bC\b|\bMC\b|CUT|MDF|MISSED', combined):
+                                if _RE_ND_CUT.search(combined):
                                     if status_map.get(full) != "wd":
                                         status_map[full] = "cut"
                             elif combined and full not in status_map:
                                 status_map[full] = "active"
 
-                        for v in obj.values():
-                            if isinstance(v, (dict, list)):
-                                find_players_nd(v, depth + 1)
-
-                find_players_nd(next_data)
+                        stack.extend((v, depth + 1) for v in reversed(obj.values())
+                                     if isinstance(v, (dict, list)))
             except Exception:
                 pass
 
@@ -386,18 +594,17 @@ def scrape_pga_leaderboard_status(url: str):
         # 3b: Raw text search — find "WD" and "CUT" near capitalized names
         # Look for patterns like "Ludvig Aberg ... WD" in the raw page text
         # This catches any rendering approach
-        name_pattern = re.compile(r"[A-Z][a-z]+(?:\s[A-Z][a-z'\-]+){1,3}")
-        all_names = name_pattern.findall(page_text)
+        all_names = _RE_PAGE_NAME.findall(page_text)
         for name in set(all_names):
             if len(name) < 6:
                 continue
             # Find all occurrences of this name in the text
             for m in re.finditer(re.escape(name), page_text):
                 window = page_text[m.start():m.start()+150].upper()
-                if re.search(r'\bWD\b|WITHDREW|WITHDRAWAL', window):
+                if _RE_TEXT_WD.search(window):
                     status_map[name] = "wd"
                     break
-                elif re.search(r'\bCUT\b|\bMC\b|MISSED CUT', window):
+                elif _RE_TEXT_CUT.search(window):
                     if status_map.get(name) != "wd":
                         status_map[name] = "cut"
                     break
@@ -407,6 +614,13 @@ def scrape_pga_leaderboard_status(url: str):
     except Exception:
         pass
 
+    if not status_map:
+        # Raise rather than return {} so a transient outage isn't cached for the next 10 minutes
+        raise ValueError(
+            "Couldn't extract player statuses. "
+            + (f"Tournament ID found: **{tid}**. " if tid else "**No tournament ID found in URL** (expected format: .../R2026002/leaderboard). ")
+            + "Try the exact URL from the leaderboard page, e.g. `pgatour.com/tournaments/2026/the-american-express/R2026002/leaderboard`"
+        )
     return status_map
 
 
@@ -417,6 +631,8 @@ def _normalize_name(name):
     return " ".join(ascii_str.lower().split())
 
 
+_LB_TO_LEAGUE_STATUS = {"wd": "wd", "cut": "cut", "active": "cut"}
+
 def apply_leaderboard_status(results, leaderboard_status_map):
     """
     For any result entry with status 'unknown_absent', look it up in the
@@ -426,6 +642,11 @@ def apply_leaderboard_status(results, leaderboard_status_map):
     Players not found in the leaderboard at all = not_entered.
     Returns updated results dict.
     """
+    unknowns = [(golfer, entry) for golfer, entry in results.items()
+                if isinstance(entry, dict) and entry.get("status") == "unknown_absent"]
+    if not unknowns:
+        return results  # nothing to classify, so skip normalising the whole leaderboard
+
     # Build normalised lookup once — WD always wins if a name appears twice
     norm_map = {}
     for api_name, api_status in leaderboard_status_map.items():
@@ -437,31 +658,24 @@ def apply_leaderboard_status(results, leaderboard_status_map):
         if api_status == "wd" or existing is None:
             norm_map[key] = api_status
 
-    for golfer, entry in results.items():
-        if not isinstance(entry, dict) or entry.get("status") != "unknown_absent":
-            continue
-        lb_status = norm_map.get(_normalize_name(golfer))
-        if lb_status == "wd":
-            entry["status"] = "wd"
-        elif lb_status == "cut":
-            entry["status"] = "cut"
-        elif lb_status == "active":
-            # In field but $0 — missed cut
-            entry["status"] = "cut"
-        else:
-            # Not found in leaderboard = not entered
-            entry["status"] = "not_entered"
+    # In the field but $0 ("active") means they missed the cut; not on the leaderboard = not entered
+    for golfer, entry in unknowns:
+        entry["status"] = _LB_TO_LEAGUE_STATUS.get(norm_map.get(_normalize_name(golfer)), "not_entered")
     return results
 
 
+_SCORE_EVEN = frozenset({"E", "EVEN", "PAR", "0", "-", "--"})
+
 def _score_to_int(score_str):
     """Convert ESPN score string ('E', '-10', '+2', '72') to int for sorting.
     Lower = better (golf). 'E'/even = 0. Unparseable = 9999 (worst).
     """
     if score_str is None:
         return 9999
-    s = str(score_str).strip().upper()
-    if s in ("E", "EVEN", "PAR", "0", "-", "--"):
+    if type(score_str) is int:
+        return score_str
+    s = (score_str if isinstance(score_str, str) else str(score_str)).strip().upper()
+    if s in _SCORE_EVEN:
         return 0
     # Strip leading + sign so int('+2') works
     s = s.lstrip("+")
@@ -471,62 +685,89 @@ def _score_to_int(score_str):
         return 9999  # WD/cut/unknown -- push to bottom
 
 
-def fetch_espn_leaderboard():
+@st.cache_resource(ttl="1d", show_spinner=False)
+def espn_url_order():
+    """ESPN endpoints with the first one answering a quick HEAD moved to the front, re-checked daily."""
+    urls = [ESPN_SCOREBOARD_URL, ESPN_LEADERBOARD_URL]
+    for url in urls:
+        try:
+            if get_http_session().head(url, timeout=3).status_code == 200:
+                return [url] + [u for u in urls if u != url]
+        except requests.RequestException:
+            continue
+    return urls
+
+@st.cache_resource
+def get_fetch_executor():
+    """Shared pool for probing both ESPN endpoints at once."""
+    return ThreadPoolExecutor(max_workers=2)
+
+def _get_json(url, timeout=10, fresh=False):
+    r = get_http_session().get(url, timeout=timeout, force_refresh=fresh)
+    r.raise_for_status()
+    return orjson.loads(r.content)
+
+def _dig(obj, *keys, default=None):
+    """Nested lookup for ESPN's JSON — returns `default` as soon as a level is missing or isn't a dict."""
+    for k in keys:
+        if not isinstance(obj, dict) or k not in obj:
+            return default
+        obj = obj[k]
+    return obj
+
+
+# Short TTL: rapid refreshes (and other viewers) share one ESPN fetch per minute
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_espn_leaderboard(_fresh=False):
+    """Current ESPN event as (players, tournament name, status message); _fresh also skips the HTTP cache."""
     raw = None
-    for url in [ESPN_SCOREBOARD_URL, ESPN_LEADERBOARD_URL]:
+    # Both endpoints are requested up front; the preferred one still wins if it answers,
+    # and a failure there no longer costs a second serial round-trip
+    futures = [get_fetch_executor().submit(_get_json, url, fresh=_fresh) for url in espn_url_order()]
+    for fut in futures:
         try:
-            r = requests.get(url, headers=HEADERS, timeout=10)
-            r.raise_for_status()
-            raw = r.json()
+            raw = fut.result()
             break
         except Exception:
             continue
+    for fut in futures:
+        fut.cancel()
     if not raw:
         raise ConnectionError("Could not reach ESPN API.")
     events = raw.get("events", [])
     if not events:
         raise ValueError("No active PGA Tour event found on ESPN right now.")
     event = events[0]
-    tournament_name = event.get("name", "Current Tournament") if isinstance(event, dict) else "Current Tournament"
-    competitions = event.get("competitions", []) if isinstance(event, dict) else []
+    tournament_name = _dig(event, "name", default="Current Tournament")
+    competitions = _dig(event, "competitions", default=[])
     if not competitions:
         raise ValueError("No competition data in ESPN response.")
     comp = competitions[0]
     if not isinstance(comp, dict):
         raise ValueError("Unexpected ESPN response format.")
-    status_obj = comp.get("status", {}) if isinstance(comp.get("status"), dict) else {}
-    round_num = status_obj.get("period", 0)
-    type_obj = status_obj.get("type", {}) if isinstance(status_obj.get("type"), dict) else {}
-    status_detail = type_obj.get("detail", "")
+    round_num = _dig(comp, "status", "period", default=0)
+    status_detail = _dig(comp, "status", "type", "detail", default="")
     status_message = f"Round {round_num} - {status_detail}" if round_num else status_detail
 
     players = []
     for c in comp.get("competitors", []):
         if not isinstance(c, dict):
             continue
-        athlete = c.get("athlete", {})
-        full_name = athlete.get("displayName", "Unknown") if isinstance(athlete, dict) else "Unknown"
+        full_name = _dig(c, "athlete", "displayName", default="Unknown")
 
         # ── Score ──────────────────────────────────────────────────────────
-        score_obj = c.get("score", {})
-        score_total = (score_obj.get("displayValue", "E") if isinstance(score_obj, dict)
-                       else (score_obj if isinstance(score_obj, str) else "E"))
+        score_obj = c.get("score")
+        score_total = score_obj if isinstance(score_obj, str) else _dig(score_obj, "displayValue", default="E")
 
         # ── Thru ───────────────────────────────────────────────────────────
-        linescores = c.get("linescores", [])
-        thru_val = ""
-        if isinstance(linescores, list) and linescores:
-            last = linescores[-1]
-            if isinstance(last, dict):
-                period = last.get("period", {})
-                if isinstance(period, dict):
-                    t = period.get("number", "")
-                    if t:
-                        thru_val = f"Thru {t}"
+        linescores = c.get("linescores")
+        t = _dig(linescores[-1], "period", "number", default="") if isinstance(linescores, list) and linescores else ""
+        thru_val = f"Thru {t}" if t else ""
 
         # ── Status — check ALL fields ESPN might use ───────────────────────
-        c_status = c.get("status", {}) if isinstance(c.get("status"), dict) else {}
-        type_obj2 = c_status.get("type", {}) if isinstance(c_status.get("type"), dict) else {}
+        type_obj2 = _dig(c, "status", "type")
+        if not isinstance(type_obj2, dict):
+            type_obj2 = {}
         # Collect every status string we can find
         status_strings = []
         for field in ("name", "shortText", "description", "detail", "state"):
@@ -553,9 +794,8 @@ def fetch_espn_leaderboard():
             espn_status = "active"
 
         # ── Position from ESPN (often blank — we'll recompute below) ──────
-        position_obj = c_status.get("position", {})
-        pos_display = (position_obj.get("displayName", "") if isinstance(position_obj, dict)
-                       else (position_obj if isinstance(position_obj, str) else ""))
+        position_obj = _dig(c, "status", "position")
+        pos_display = position_obj if isinstance(position_obj, str) else _dig(position_obj, "displayName", default="")
 
         players.append({
             "name": full_name,
@@ -596,6 +836,16 @@ def fetch_espn_leaderboard():
     all_players = active + inactive
     return all_players, tournament_name, status_message
 
+def fetch_payout_and_leaderboard(payout_url, fresh=False):
+    """scrape_pga_payout_table and fetch_espn_leaderboard side by side; each slot is its result or the exception."""
+    if fresh:
+        scrape_pga_payout_table.clear(payout_url)
+    # A private pool: fetch_espn_leaderboard itself waits on get_fetch_executor()
+    with _script_pool(2) as pool:
+        payout = pool.submit(_result_or_error, partial(scrape_pga_payout_table, _fresh=fresh), payout_url)
+        board = pool.submit(_result_or_error, fetch_espn_leaderboard)
+        return payout.result(), board.result()
+
 
 def espn_status_to_league_status(espn_status, prize):
     """
@@ -632,67 +882,94 @@ def build_results_from_espn(players, payout_map, all_league_golfers=None):
 # ── League logic ───────────────────────────────────────────────────────────────
 
 def get_team_earnings_for_tournament(team_golfers, tournament_results):
-    earnings = [(g, get_prize(tournament_results[g])) for g in team_golfers
-                if g in tournament_results and get_prize(tournament_results[g]) > 0]
-    earnings.sort(key=lambda x: x[1], reverse=True)
-    top3 = earnings[:3]
+    earnings = [(g, prize) for g in team_golfers
+                if (entry := tournament_results.get(g)) is not None and (prize := entry["prize"]) > 0]
+    top3 = heapq.nlargest(3, earnings, key=lambda x: x[1])
     return sum(e[1] for e in top3), top3
 
 def get_ordered_tournaments(data):
     order = data.get("tournament_order", [])
-    all_t = list(data.get("tournaments", {}).keys())
-    return order + [t for t in all_t if t not in order]
+    in_order = set(order)
+    return order + [t for t in data.get("tournaments", {}) if t not in in_order]
 
-def compute_standings(data):
-    standings = {tn: {"total": 0, "tournaments": {}} for tn in data["teams"]}
-    for t_name in get_ordered_tournaments(data):
+def build_prize_frame(data, golfers):
+    """golfer × tournament prize matrix (0 where a golfer has no result), columns in season order."""
+    ordered = get_ordered_tournaments(data)
+    index = list(dict.fromkeys(golfers))
+    cols = {}
+    for t_name in ordered:
         results = data["tournaments"].get(t_name, {}).get("results", {})
-        for team_name, golfers in data["teams"].items():
-            total, top3 = get_team_earnings_for_tournament(golfers, results)
+        cols[t_name] = [results[g]["prize"] if g in results else 0 for g in index]
+    return pd.DataFrame(cols, index=index, columns=ordered, dtype=float)
+
+def compute_season(data):
+    """
+    Standings and cumulative earnings history in a single pass over the season,
+    so each team's top-3 is only worked out once per tournament.
+    Returns (standings, history) — see compute_standings / compute_earnings_history.
+    """
+    ordered = get_ordered_tournaments(data)
+    teams = data["teams"]
+    prizes = build_prize_frame(data, [g for gs in teams.values() for g in gs])
+    # Top 3 of every tournament for each team in one argsort over its roster × tournament block.
+    # A stable sort keeps roster order among equal prizes, same as get_team_earnings_for_tournament.
+    team_top3 = {}
+    for team_name, golfers in teams.items():
+        vals = prizes.reindex(golfers).to_numpy()
+        top_idx = np.argsort(-vals, axis=0, kind="stable")[:3]
+        top_vals = np.take_along_axis(vals, top_idx, axis=0)
+        team_top3[team_name] = [
+            [(golfers[i], v) for i, v in zip(idx_col, val_col) if v > 0]
+            for idx_col, val_col in zip(top_idx.T.tolist(), top_vals.T.tolist())
+        ]
+
+    standings = {tn: {"total": 0, "tournaments": {}} for tn in teams}
+    history = {tn: [] for tn in teams}
+    for j, t_name in enumerate(ordered):
+        for team_name in teams:
+            top3 = team_top3[team_name][j]
+            total = sum(e[1] for e in top3)
             standings[team_name]["total"] += total
             standings[team_name]["tournaments"][t_name] = {"total": total, "top3": top3}
-    return standings
+        # Rank straight off the sort — no intermediate rank dict or second team loop
+        for rank, team_name in enumerate(sorted(teams, key=lambda t: standings[t]["total"], reverse=True), 1):
+            history[team_name].append({"tournament": t_name, "cumulative": standings[team_name]["total"], "rank": rank})
+    return standings, (history if ordered else {})
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_season(_data, version):
+    """compute_season memoized on the session's data_version (_data itself isn't hashed)."""
+    return compute_season(_data)
+
+def compute_standings(data):
+    return compute_season(data)[0]
 
 def compute_earnings_history(data):
     """Cumulative prize money per team after each tournament, used for the chart."""
-    ordered = get_ordered_tournaments(data)
-    if not ordered:
-        return {}
-    teams = list(data["teams"].keys())
-    cumulative = {t: 0.0 for t in teams}
-    history = {t: [] for t in teams}
-    for t_name in ordered:
-        results = data["tournaments"].get(t_name, {}).get("results", {})
-        for team_name in teams:
-            total, _ = get_team_earnings_for_tournament(data["teams"][team_name], results)
-            cumulative[team_name] += total
-        sorted_t = sorted(teams, key=lambda t: cumulative[t], reverse=True)
-        ranks = {t: i + 1 for i, t in enumerate(sorted_t)}
-        for team_name in teams:
-            history[team_name].append({"tournament": t_name, "cumulative": cumulative[team_name], "rank": ranks[team_name]})
-    return history
+    return compute_season(data)[1]
 
-def compute_tied_prize(pos, payout, live_players):
+def _split_prize(pos, n_tied, payout):
     """
     Golf tie rule: players tied at position P share the purse for positions
     P through P+(n_tied-1), divided equally among them.
     E.g. 3 players tied for 5th split prizes for 5th+6th+7th equally.
     """
-    if pos <= 0 or pos == 999:
-        return 0.0
-    # Count how many active players are at this exact position
-    n_tied = sum(1 for p in live_players if p.get("position") == pos
-                 and p.get("espn_status") == "active")
     if n_tied <= 1:
         return float(payout.get(pos, 0))
     # Sum prizes for pos through pos+n_tied-1
     total_pool = sum(payout.get(p, 0) for p in range(pos, pos + n_tied))
     return round(total_pool / n_tied, 2)
 
+def tied_prize_map(payout, live_players):
+    """Tie-split prize for every position on the board, counting active players per position in one pass: {position: prize}."""
+    n_active = Counter(p.get("position") for p in live_players if p.get("espn_status") == "active")
+    return {pos: 0.0 if pos <= 0 or pos == 999 else _split_prize(pos, n_active[pos], payout)
+            for pos in {int(p["position"]) for p in live_players}}
+
 
 def compute_live_team_standings(data, live_payout, live_players):
-    # Ensure payout keys are int for consistent lookup
-    payout = {int(k): v for k, v in live_payout.items()}
+    # live_payout keys are ints: scrapers emit them and load_data coerces the JSON strings
+    pos_prize = tied_prize_map(live_payout, live_players)
     name_to_prize = {}
     for p in live_players:
         espn_st = p.get("espn_status", "")
@@ -701,33 +978,174 @@ def compute_live_team_standings(data, live_payout, live_players):
             name_to_prize[p["name"]] = 0
         else:
             # Use split-prize for ties
-            name_to_prize[p["name"]] = compute_tied_prize(int(pos), payout, live_players)
+            name_to_prize[p["name"]] = pos_prize[int(pos)]
     results = []
     for team_name, golfers in data["teams"].items():
-        earnings = [(g, name_to_prize[g]) for g in golfers if g in name_to_prize and name_to_prize[g] > 0]
-        earnings.sort(key=lambda x: x[1], reverse=True)
-        top3 = earnings[:3]
+        earnings = [(g, prize) for g in golfers if (prize := name_to_prize.get(g, 0)) > 0]
+        top3 = heapq.nlargest(3, earnings, key=lambda x: x[1])
         results.append((team_name, sum(e[1] for e in top3), top3))
     results.sort(key=lambda x: x[1], reverse=True)
     return results
 
-def get_unowned_golfer_earnings(data):
-    """Golfers in tournament results but not on any roster, ranked by total prize."""
-    owned = set(g for gs in data["teams"].values() for g in gs)
+@st.cache_data(show_spinner=False, max_entries=64)
+def unknown_golfers(_data, version, t_name):
+    """Rostered golfers still marked unknown_absent in t_name, per data version."""
+    team_of = golfer_index(_data)
+    return [g for g, v in _data["tournaments"][t_name].get("results", {}).items()
+            if isinstance(v, dict) and v.get("status") == "unknown_absent" and g in team_of]
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def results_frame(_data, version):
+    """Every recorded result as one (tournament, golfer)-indexed frame of prize/status, per data version."""
+    return pd.DataFrame(
+        [(t_name, g, e["prize"], e["status"])
+         for t_name, t_info in _data["tournaments"].items() for g, e in t_info.get("results", {}).items()],
+        columns=["tournament", "golfer", "prize", "status"],
+    ).astype({"prize": float, "status": STATUS_CATS}).set_index(["tournament", "golfer"])
+
+def golfer_season_stats(data, results, golfers, team_of, standings):
+    """
+    Season counts per golfer (cashes, cuts, WD/DQ, not entered) plus total prize and the
+    prize that made team_of[golfer]'s top 3, summed per golfer off the results_frame().
+    """
+    unique = list(dict.fromkeys(golfers))
+    counted = {(t_name, g) for tn, s in standings.items() for t_name, t_data in s["tournaments"].items()
+               for g, _ in t_data["top3"] if team_of.get(g) == tn}
+    # Every tournament × golfer cell; a golfer with no entry counts as not entered
+    long = results.reindex(pd.MultiIndex.from_product([list(data["tournaments"]), unique], names=results.index.names))
+    prize = long["prize"].fillna(0)
+    status = long["status"].fillna("not_entered")
+    cut, wd = status.eq("cut"), status.eq("wd")
+    not_entered = status.isin(["not_entered", "unknown_absent"])
+    cash = ~(cut | wd | not_entered) & prize.gt(0)
+    return pd.DataFrame({
+        "Cashes": cash, "Cuts": cut, "WD/DQ": wd, "Not Entered": not_entered,
+        "Total Prize": prize.where(cash, 0), "Counted for Team": prize.where(long.index.isin(list(counted)), 0),
+    }).groupby(level="golfer", sort=False).sum().reindex(golfers, fill_value=0).rename_axis("Golfer")
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def team_golfer_stats(_data, version, team):
+    """golfer_season_stats for one roster (alphabetical, counted for that team), per data version."""
+    golfers = _data["teams"][team]
+    return golfer_season_stats(_data, results_frame(_data, version), sorted(golfers),
+                               dict.fromkeys(golfers, team), cached_season(_data, version)[0])
+
+def golfer_index(data):
+    """golfer → team name for O(1) roster lookups (a golfer on two rosters maps to the first team)."""
+    index = {}
+    for t, gs in data["teams"].items():
+        for g in gs:
+            index.setdefault(g, t)
+    return index
+
+def get_unowned_golfer_earnings(data, owned=None):
+    """Golfers in tournament results but not on any roster (`owned`, e.g. a golfer_index), ranked by total prize."""
+    if owned is None:
+        owned = golfer_index(data)
     earnings = defaultdict(float)
     for t_info in data["tournaments"].values():
         for golfer, entry in t_info.get("results", {}).items():
             if golfer not in owned:
-                prize = get_prize(entry)
+                prize = entry["prize"]
                 if prize > 0:
                     earnings[golfer] += prize
     return sorted(earnings.items(), key=lambda x: x[1], reverse=True)
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_unowned(_data, version, _owned=None):
+    """get_unowned_golfer_earnings memoized on the session's data_version (`_owned` is built from the same version)."""
+    return get_unowned_golfer_earnings(_data, _owned)
+
+# Same few hundred amounts get formatted on every rerun (cards, top-3 strings, gap table)
+@lru_cache(maxsize=4096)
 def fmt_money(val):
     if not val:
         return "$0"
     return f"${float(val):,.0f}"
 
+def money_columns(cols):
+    """column_config that shows numeric columns as fmt_money does, rendered client-side (no Styler pass)."""
+    return {c: st.column_config.NumberColumn(format="dollar", step=1) for c in cols}
+
+def classify_editor(golfers, team_of):
+    """One editable Golfer/Team/Status table for sorting unknown_absent players: {golfer: status}."""
+    edited = st.data_editor(
+        pd.DataFrame({"Golfer": golfers, "Team": [team_of.get(g, "?") for g in golfers], "Status": "cut"}),
+        column_config={"Status": st.column_config.SelectboxColumn(
+            options=["cut", "not_entered", "wd"], required=True,
+            help="cut = was in field but missed cut | not_entered = wasn't in the field | wd = withdrew or DQ'd")},
+        disabled=["Golfer", "Team"], num_rows="fixed", hide_index=True, width="stretch",
+    )
+    return dict(zip(edited["Golfer"], edited["Status"]))
+
+# cache_resource hands back the same Figure instead of unpickling a copy each rerun; st.plotly_chart doesn't mutate it
+@st.cache_resource(show_spinner=False, max_entries=16)
+def earnings_chart(_history, teams_by_earnings, version):
+    """Cumulative-earnings figure for the Standings page, rebuilt only when the data version changes."""
+    colors = ["#2d6a2d", "#e07b2a", "#1a6fa8", "#a82828", "#7b3fa8", "#a8963f", "#2a9d8f", "#e63946", "#457b9d", "#f4a261"]
+    color_map = {t: colors[i % len(colors)] for i, t in enumerate(teams_by_earnings)}
+
+    fig = go.Figure()
+    for team_name in teams_by_earnings:
+        events = _history[team_name]
+        t_labels = [e["tournament"] for e in events]
+        earnings_vals = [e["cumulative"] for e in events]
+        ranks = [e["rank"] for e in events]
+        final_earnings = earnings_vals[-1] if earnings_vals else 0
+        final_rank = ranks[-1] if ranks else 0
+
+        fig.add_trace(go.Scatter(
+            x=t_labels,
+            y=earnings_vals,
+            mode="lines+markers+text",
+            name=f"{team_name}",
+            line=dict(color=color_map[team_name], width=3),
+            marker=dict(size=10, color=color_map[team_name]),
+            # Rank + name label at the end of each line
+            text=[""] * (len(t_labels) - 1) + [f"  #{final_rank} {team_name}"],
+            textposition="middle right",
+            textfont=dict(color=color_map[team_name], size=12, family="Arial Black"),
+            hovertext=[
+                f"<b>{team_name}</b><br>After: {t}<br>Total: {fmt_money(e)}<br>Rank: #{r}"
+                for t, e, r in zip(t_labels, earnings_vals, ranks)
+            ],
+            hoverinfo="text",
+        ))
+
+    fig.update_layout(
+        xaxis=dict(
+            title=dict(text="Tournament", font=dict(size=13)),
+            tickfont=dict(size=12),
+            showgrid=True,
+            gridcolor="#e0ece0",
+        ),
+        yaxis=dict(
+            title=dict(text="Cumulative Prize Money (USD)", font=dict(size=13)),
+            tickprefix="$",
+            tickformat=",.0f",
+            tickfont=dict(size=11),
+            rangemode="tozero",
+            showgrid=True,
+            gridcolor="#e0ece0",
+        ),
+        # Legend on right side, ordered by current earnings (top to bottom)
+        legend=dict(
+            title=dict(text="Team", font=dict(size=12)),
+            orientation="v",
+            yanchor="top", y=1,
+            xanchor="left", x=1.02,
+            font=dict(size=11),
+            traceorder="normal",
+        ),
+        height=500,
+        # Extra right margin for end-of-line team labels
+        margin=dict(l=70, r=200, t=30, b=60),
+        plot_bgcolor="#f8fdf6",
+        paper_bgcolor="#ffffff",
+        hovermode="x unified",
+    )
+    return fig
+
 # ── App setup ─────────────────────────────────────────────────────────────────
 
 st.set_page_config(page_title="Fantasy Golf League", page_icon="🏌️", layout="wide")
@@ -741,27 +1159,40 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-for key, default in [("data", None), ("live_players", []), ("live_status", "")]:
-    if key not in st.session_state:
-        st.session_state[key] = load_data() if key == "data" else default
+if "data" not in st.session_state:
+    st.session_state.data = load_data()
+st.session_state.setdefault("live_players", [])
+st.session_state.setdefault("live_status", "")
+if "data_version" not in st.session_state:
+    bump_data_version()
 
 data = st.session_state.data
+if (save_error := _last_saved()["error"]) is not None:
+    st.error(f"⚠️ The last save couldn't be written to {DATA_FILE} ({save_error}). Recent changes aren't on disk yet.")
+
+# Roster lookups only change with the data, so keep them across reruns until data_version moves
+if st.session_state.get("roster_version") != st.session_state.data_version:
+    st.session_state.golfer_to_team = golfer_index(data)
+    st.session_state.league_golfers = sorted(st.session_state.golfer_to_team)
+    st.session_state.sorted_rosters = {t: sorted(gs) for t, gs in sorted(data["teams"].items())}
+    st.session_state.roster_version = st.session_state.data_version
+golfer_to_team = st.session_state.golfer_to_team
+league_golfers = st.session_state.league_golfers
+sorted_rosters = st.session_state.sorted_rosters  # team → roster, both alphabetical
 
 # Restore persisted payout from data file on first load
 if "live_payout" not in st.session_state:
     ls = data.get("live_state", {})
     st.session_state.live_payout = ls.get("payout", {})
     st.session_state.live_tourney_name = ls.get("tourney_name", "")
-if "live_tourney_name" not in st.session_state:
-    st.session_state.live_tourney_name = data.get("live_state", {}).get("tourney_name", "")
+st.session_state.setdefault("live_tourney_name", data.get("live_state", {}).get("tourney_name", ""))
 
 try:
     ADMIN_PASSWORD = st.secrets["ADMIN_PASSWORD"]
 except Exception:
     ADMIN_PASSWORD = "golf2026"
 
-if "is_admin" not in st.session_state:
-    st.session_state.is_admin = False
+st.session_state.setdefault("is_admin", False)
 
 st.sidebar.title("🏌️ Fantasy Golf")
 st.sidebar.markdown("---")
@@ -816,22 +1247,62 @@ if page == "🔴 Live Leaderboard":
                                         placeholder="https://www.pgatour.com/article/...")
         with col_btn:
             fetch_results = st.button("Fetch", type="primary", key="fetch_results")
+        fresh_results = st.checkbox("Re-scrape", key="fresh_results",
+                                    help="Ignore the saved copy of this article, e.g. if payouts were posted or corrected since")
 
         if fetch_results and results_url:
             with st.spinner("Scraping..."):
                 try:
-                    result_players, tourney_name = scrape_pga_results_article(results_url)
+                    result_players, tourney_name = rescrape(scrape_pga_results_article, results_url, fresh_results)
                     st.session_state.live_players = [{**p, "espn_status": p["status"], "score": "", "thru": "F"} for p in result_players]
                     st.session_state.live_tourney_name = tourney_name
                     st.session_state.live_status = "Final"
-                    st.session_state.live_payout = {p["position"]: p["prize"] for p in result_players if p["prize"] > 0}
+                    st.session_state.live_payout = article_payout(result_players)
                     st.success(f"Fetched **{tourney_name}** — {len(result_players)} players found.")
                 except Exception as e:
                     st.error(f"Failed: {e}")
 
+        with st.expander("📚 Bulk import URLs"):
+            bulk_urls = st.text_area("One 'Points and Payouts' URL per line", key="bulk_urls",
+                                     placeholder="https://www.pgatour.com/article/...")
+            if st.button("Import All", key="bulk_import"):
+                urls = list(dict.fromkeys(u.strip() for u in bulk_urls.splitlines() if u.strip()))
+                with st.spinner(f"Scraping {len(urls)} article(s)..."):
+                    scraped = scrape_many(urls)
+                imported, problems = [], []
+                for url, res in scraped:
+                    if isinstance(res, Exception):
+                        problems.append(f"{url}: {res}")
+                        continue
+                    result_players, tourney_name = res
+                    if not tourney_name:
+                        problems.append(f"{url}: no tournament name on the page — import it on its own above.")
+                        continue
+                    if tourney_name in data["tournaments"]:
+                        # Never clobber saved results (and any manual classifications) from a batch
+                        problems.append(f"{url}: **{tourney_name}** is already in the season — import it on its own above to replace it.")
+                        continue
+                    if tourney_name not in data.get("tournament_order", []):
+                        data.setdefault("tournament_order", []).append(tourney_name)
+                    data["tournaments"][tourney_name] = {
+                        "results": build_results_from_espn(result_players, article_payout(result_players), league_golfers)}
+                    imported.append(tourney_name)
+                # Shown after the rerun that lets the rest of the page pick up the new tournaments
+                st.session_state.bulk_report = (imported, problems)
+                if imported:
+                    save_data(data)
+                    st.rerun()
+            if report := st.session_state.pop("bulk_report", None):
+                imported, problems = report
+                for problem in problems:
+                    st.error(problem)
+                if imported:
+                    st.success(f"Imported {len(imported)} tournament(s): " + ", ".join(imported)
+                               + " — review any ❓ players under 🗓️ Tournaments.")
+
         if st.session_state.live_players and st.session_state.live_status == "Final":
             st.markdown("---")
-            all_golfers = list(set(g for gs in data["teams"].values() for g in gs))
+            all_golfers = league_golfers
             results_preview = build_results_from_espn(st.session_state.live_players, st.session_state.live_payout, all_golfers)
 
             unknown_count = sum(1 for v in results_preview.values() if v["status"] == "unknown_absent")
@@ -844,11 +1315,11 @@ if page == "🔴 Live Leaderboard":
             st.subheader(f"Preview: {st.session_state.live_tourney_name}")
             preview_rows = sorted([{
                 "Golfer": g,
-                "Team": next((t for t, gs in data["teams"].items() if g in gs), "?"),
+                "Team": golfer_to_team.get(g, "?"),
                 "Status": STATUS_EMOJI.get(results_preview[g]["status"], results_preview[g]["status"]),
                 "Prize": results_preview[g]["prize"],
-            } for g in sorted(all_golfers)], key=lambda x: x["Prize"], reverse=True)
-            st.dataframe(pd.DataFrame(preview_rows).style.format({"Prize": fmt_money}), width="stretch", hide_index=True)
+            } for g in all_golfers], key=lambda x: x["Prize"], reverse=True)
+            st.dataframe(pd.DataFrame(preview_rows), column_config=money_columns(["Prize"]), width="stretch", hide_index=True)
 
             col1, col2 = st.columns([2, 1])
             with col1:
@@ -875,9 +1346,7 @@ if page == "🔴 Live Leaderboard":
             # ── Review unknown_absent ─────────────────────────────────────────
             if import_name and import_name in data["tournaments"]:
                 saved_results = data["tournaments"][import_name]["results"]
-                league_set = set(g for gs in data["teams"].values() for g in gs)
-                unknowns = [g for g, v in saved_results.items()
-                            if isinstance(v, dict) and v.get("status") == "unknown_absent" and g in league_set]
+                unknowns = unknown_golfers(data, st.session_state.data_version, import_name)
                 if unknowns:
                     st.markdown("---")
                     st.subheader("❓ Classify Missing Players")
@@ -886,20 +1355,7 @@ if page == "🔴 Live Leaderboard":
                         "They could have **missed the cut**, **withdrawn**, or **weren't in the field** at all."
                     )
                     with st.form("review_unknowns"):
-                        updates = {}
-                        for i in range(0, len(unknowns), 3):
-                            rcols = st.columns(3)
-                            for j, golfer in enumerate(unknowns[i:i+3]):
-                                team = next((t for t, gs in data["teams"].items() if golfer in gs), "?")
-                                with rcols[j]:
-                                    st.markdown(f"**{golfer}**  \n_{team}_")
-                                    updates[golfer] = st.selectbox(
-                                        golfer,
-                                        ["cut", "not_entered", "wd"],
-                                        key=f"rev_{import_name}_{golfer}",
-                                        label_visibility="collapsed",
-                                        help="cut = was in field but missed cut | not_entered = wasn't in the field | wd = withdrew or DQ'd"
-                                    )
+                        updates = classify_editor(unknowns, golfer_to_team)
                         if st.form_submit_button("✅ Save Classifications", type="primary"):
                             for golfer, status in updates.items():
                                 saved_results[golfer]["status"] = status
@@ -910,176 +1366,224 @@ if page == "🔴 Live Leaderboard":
 
     # ── MODE B: Live tracking ─────────────────────────────────────────────────
     else:
-        st.subheader("🔴 Live Tournament Tracking")
-        st.caption("ESPN's API only works for the current active tournament week.")
-
-        st.markdown("**Step 1 — Load Payout Table**")
-        if st.session_state.live_payout:
-            payout_tn = st.session_state.live_tourney_name or "tournament"
-            st.success(f"✅ Payout loaded: **{payout_tn}** ({len(st.session_state.live_payout)} positions, winner: {fmt_money(st.session_state.live_payout.get(1, 0))})")
-            col_ep1, col_ep2 = st.columns([3, 1])
-            with col_ep1:
-                with st.expander("View / change payout table"):
-                    st.dataframe(pd.DataFrame([{"Pos": k, "Prize": fmt_money(v)} for k, v in sorted(st.session_state.live_payout.items())]), width="stretch", hide_index=True)
-                    new_url = st.text_input("Load a different payout URL", key="replace_payout_url",
-                                            placeholder="https://www.pgatour.com/article/news/.../purse-breakdown-...")
-                    if st.button("Load new payout", key="replace_payout_btn"):
+        @st.fragment
+        def live_tracking():
+            """Payout/ESPN loading, team projections and the full board; its widgets rerun only this block."""
+            st.subheader("🔴 Live Tournament Tracking")
+            st.caption("ESPN's API only works for the current active tournament week.")
+
+            st.markdown("**Step 1 — Load Payout Table**")
+            fresh_payout = st.session_state.is_admin and st.checkbox(
+                "Re-scrape payout article", key="fresh_payout",
+                help="Ignore the saved copy of the article, e.g. if the purse breakdown was corrected since")
+            if st.session_state.live_payout:
+                payout_tn = st.session_state.live_tourney_name or "tournament"
+                st.success(f"✅ Payout loaded: **{payout_tn}** ({len(st.session_state.live_payout)} positions, winner: {fmt_money(st.session_state.live_payout.get(1, 0))})")
+                col_ep1, col_ep2 = st.columns([3, 1])
+                with col_ep1:
+                    with st.expander("View / change payout table"):
+                        st.dataframe(pd.DataFrame(sorted(st.session_state.live_payout.items()), columns=["Pos", "Prize"]),
+                                     column_config=money_columns(["Prize"]), width="stretch", hide_index=True)
+                        new_url = st.text_input("Load a different payout URL", key="replace_payout_url",
+                                                placeholder="https://www.pgatour.com/article/news/.../purse-breakdown-...")
+                        if st.button("Load new payout", key="replace_payout_btn"):
+                            with st.spinner("Scraping..."):
+                                try:
+                                    pm, tn = rescrape(scrape_pga_payout_table, new_url, fresh_payout)
+                                    st.session_state.live_payout = pm
+                                    st.session_state.live_tourney_name = tn
+                                    save_live_state(data, pm, tn)
+                                    st.success(f"Loaded **{tn}**")
+                                    st.rerun()
+                                except Exception as e:
+                                    st.error(f"Failed: {e}")
+                with col_ep2:
+                    if st.button("🗑️ Clear payout", key="clear_payout"):
+                        st.session_state.live_payout = {}
+                        st.session_state.live_tourney_name = ""
+                        save_live_state(data, {}, "")
+                        st.rerun()
+            else:
+                col_url, col_btn, col_both = st.columns([4, 1, 2])
+                with col_url:
+                    payout_url = st.text_input("Payout URL", label_visibility="collapsed",
+                                               placeholder="https://www.pgatour.com/article/news/.../purse-breakdown-...")
+                with col_btn:
+                    if st.button("Load", type="primary", key="load_payout"):
                         with st.spinner("Scraping..."):
                             try:
-                                pm, tn = scrape_pga_payout_table(new_url)
-                                pm = {int(k): v for k, v in pm.items()}
+                                pm, tn = rescrape(scrape_pga_payout_table, payout_url, fresh_payout)
                                 st.session_state.live_payout = pm
                                 st.session_state.live_tourney_name = tn
+                                st.session_state.live_status = ""
                                 save_live_state(data, pm, tn)
-                                st.success(f"Loaded **{tn}**")
+                                st.success(f"Loaded **{tn}** — winner: {fmt_money(pm.get(1, 0))}")
                                 st.rerun()
                             except Exception as e:
                                 st.error(f"Failed: {e}")
-            with col_ep2:
-                if st.button("🗑️ Clear payout", key="clear_payout"):
-                    st.session_state.live_payout = {}
-                    st.session_state.live_tourney_name = ""
-                    save_live_state(data, {}, "")
-                    st.rerun()
-        else:
-            col_url, col_btn = st.columns([4, 1])
-            with col_url:
-                payout_url = st.text_input("Payout URL", label_visibility="collapsed",
-                                           placeholder="https://www.pgatour.com/article/news/.../purse-breakdown-...")
-            with col_btn:
-                if st.button("Load", type="primary", key="load_payout"):
-                    with st.spinner("Scraping..."):
-                        try:
-                            pm, tn = scrape_pga_payout_table(payout_url)
-                            pm = {int(k): v for k, v in pm.items()}
+                with col_both:
+                    if st.button("Load + Fetch Leaderboard", key="load_payout_and_live") and payout_url:
+                        with st.spinner("Scraping payout and fetching ESPN..."):
+                            payout_res, board_res = fetch_payout_and_leaderboard(payout_url, fresh_payout)
+                        if isinstance(payout_res, Exception):
+                            st.error(f"Payout failed: {payout_res}")
+                        else:
+                            pm, tn = payout_res
                             st.session_state.live_payout = pm
                             st.session_state.live_tourney_name = tn
-                            st.session_state.live_status = ""
                             save_live_state(data, pm, tn)
-                            st.success(f"Loaded **{tn}** — winner: {fmt_money(pm.get(1, 0))}")
+                        if isinstance(board_res, Exception):
+                            st.error(f"Could not fetch: {board_res}")
+                        else:
+                            players, t_name, status_msg = board_res
+                            st.session_state.live_players = players
+                            st.session_state.live_status = status_msg
+                            if not st.session_state.live_tourney_name:
+                                st.session_state.live_tourney_name = t_name
+                        if not isinstance(payout_res, Exception) and not isinstance(board_res, Exception):
                             st.rerun()
-                        except Exception as e:
-                            st.error(f"Failed: {e}")
 
-        st.markdown("**Step 2 — Fetch Live Standings from ESPN**")
-        if st.button("🔄 Refresh Leaderboard", type="primary", key="refresh_live"):
-            with st.spinner("Fetching..."):
-                try:
-                    players, t_name, status_msg = fetch_espn_leaderboard()
-                    st.session_state.live_players = players
-                    st.session_state.live_status = status_msg
-                    if not st.session_state.live_tourney_name:
-                        st.session_state.live_tourney_name = t_name
-                    st.success(f"Fetched {len(players)} players — {status_msg}")
-                except Exception as e:
-                    st.error(f"Could not fetch: {e}")
+            st.markdown("**Step 2 — Fetch Live Standings from ESPN**")
+            refresh_col, force_col = st.columns([1, 1])
+            force_live = False
+            with refresh_col:
+                refresh_live = st.button("🔄 Refresh Leaderboard", type="primary", key="refresh_live")
+            with force_col:
+                if st.session_state.is_admin and st.button("Force refresh", key="force_refresh_live",
+                                                           help="Re-fetch from ESPN, skipping the one-minute leaderboard cache"):
+                    fetch_espn_leaderboard.clear()
+                    refresh_live = force_live = True
+            if refresh_live:
+                with st.spinner("Fetching..."):
+                    try:
+                        players, t_name, status_msg = fetch_espn_leaderboard(_fresh=force_live)
+                        st.session_state.live_players = players
+                        st.session_state.live_status = status_msg
+                        if not st.session_state.live_tourney_name:
+                            st.session_state.live_tourney_name = t_name
+                        st.success(f"Fetched {len(players)} players — {status_msg}")
+                    except Exception as e:
+                        st.error(f"Could not fetch: {e}")
+
+            if st.session_state.live_players and st.session_state.live_status != "Final":
+                tourney_label = st.session_state.live_tourney_name or "Current Tournament"
+                st.markdown("---")
+                st.subheader(f"{tourney_label} — {st.session_state.live_status}")
 
-        if st.session_state.live_players and st.session_state.live_status != "Final":
-            tourney_label = st.session_state.live_tourney_name or "Current Tournament"
-            st.markdown("---")
-            st.subheader(f"{tourney_label} — {st.session_state.live_status}")
+                if st.session_state.is_admin:
+                    with st.expander("💾 Import as Final Results"):
+                        if not st.session_state.live_payout:
+                            st.warning("Load payout table first.")
+                        else:
+                            c1, c2 = st.columns([2, 1])
+                            with c1:
+                                iname = st.text_input("Save as", value=tourney_label, key="import_live_name")
+                            with c2:
+                                st.markdown("<br>", unsafe_allow_html=True)
+                                if st.button("💾 Save to Season", type="primary", key="save_live"):
+                                    all_g = league_golfers
+                                    res = build_results_from_espn(st.session_state.live_players, st.session_state.live_payout, all_g)
+                                    if iname not in data.get("tournament_order", []):
+                                        data.setdefault("tournament_order", []).append(iname)
+                                    data["tournaments"][iname] = {"results": res}
+                                    save_data(data)
+                                    st.success(f"Saved {iname}!")
+                                    st.rerun()
 
-            if st.session_state.is_admin:
-                with st.expander("💾 Import as Final Results"):
+                # Shared by both tabs: name lookup, the tie-split prize for every position on the board and the
+                # team projections. Refreshes and payout loads replace these objects wholesale, so identity plus
+                # data_version tells whether an incidental rerun (expander, text input) can reuse the last pass.
+                live_memo = st.session_state.get("live_memo")
+                if not (live_memo and live_memo["players"] is st.session_state.live_players
+                        and live_memo["payout"] is st.session_state.live_payout
+                        and live_memo["version"] == st.session_state.data_version):
+                    payout = st.session_state.live_payout
+                    live_memo = st.session_state.live_memo = {
+                        "players": st.session_state.live_players, "payout": payout,
+                        "version": st.session_state.data_version,
+                        "pos_prize": tied_prize_map(payout, st.session_state.live_players),
+                        "espn_by_name": {p["name"]: p for p in st.session_state.live_players},
+                        "proj": compute_live_team_standings(data, payout, st.session_state.live_players) if payout else [],
+                    }
+                payout, pos_prize, espn_by_name = live_memo["payout"], live_memo["pos_prize"], live_memo["espn_by_name"]
+
+                tab1, tab2 = st.tabs(["🏆 Team Projections", "📋 Full Leaderboard"])
+                with tab1:
                     if not st.session_state.live_payout:
-                        st.warning("Load payout table first.")
+                        st.warning("Load payout table to see projected earnings.")
                     else:
-                        c1, c2 = st.columns([2, 1])
-                        with c1:
-                            iname = st.text_input("Save as", value=tourney_label, key="import_live_name")
-                        with c2:
-                            st.markdown("<br>", unsafe_allow_html=True)
-                            if st.button("💾 Save to Season", type="primary", key="save_live"):
-                                all_g = list(set(g for gs in data["teams"].values() for g in gs))
-                                res = build_results_from_espn(st.session_state.live_players, st.session_state.live_payout, all_g)
-                                if iname not in data.get("tournament_order", []):
-                                    data.setdefault("tournament_order", []).append(iname)
-                                data["tournaments"][iname] = {"results": res}
-                                save_data(data)
-                                st.success(f"Saved {iname}!")
-                                st.rerun()
-
-            tab1, tab2 = st.tabs(["🏆 Team Projections", "📋 Full Leaderboard"])
-            with tab1:
-                if not st.session_state.live_payout:
-                    st.warning("Load payout table to see projected earnings.")
-                else:
-                    proj = compute_live_team_standings(data, st.session_state.live_payout, st.session_state.live_players)
-                    rank_labels = ["🥇", "🥈", "🥉"]
-                    cols = st.columns(min(len(proj), 4))
-                    for i, (tn, total, _) in enumerate(proj[:4]):
-                        with cols[i]:
-                            medal = rank_labels[i] if i < 3 else f"#{i+1}"
-                            st.markdown(f'<div class="metric-card"><div style="font-size:1rem;font-weight:600;">{medal} {tn}</div><div class="big-number">{fmt_money(total)}</div><div style="font-size:0.8rem;color:#555;">projected</div></div>', unsafe_allow_html=True)
-                    espn_by_name = {p["name"]: p for p in st.session_state.live_players}
-                    for rank, (tn, total, top3) in enumerate(proj, 1):
-                        medal = rank_labels[rank-1] if rank <= 3 else f"#{rank}"
-                        with st.expander(f"{medal} {tn} — {fmt_money(total)} projected"):
-                            rows = []
-                            for g in sorted(data["teams"][tn]):
-                                p = espn_by_name.get(g)
-                                in_top3 = any(g == t[0] for t in top3)
-                                if p:
-                                    espn_st = p.get("espn_status", "")
-                                    if espn_st == "cut": disp, prize = "✂️ CUT", 0
-                                    elif espn_st == "wd": disp, prize = "🚫 WD/DQ", 0
+                        proj = live_memo["proj"]
+                        rank_labels = ["🥇", "🥈", "🥉"]
+                        cols = st.columns(min(len(proj), 4))
+                        for i, (tn, total, _) in enumerate(proj[:4]):
+                            with cols[i]:
+                                medal = rank_labels[i] if i < 3 else f"#{i+1}"
+                                st.markdown(f'<div class="metric-card"><div style="font-size:1rem;font-weight:600;">{medal} {tn}</div><div class="big-number">{fmt_money(total)}</div><div style="font-size:0.8rem;color:#555;">projected</div></div>', unsafe_allow_html=True)
+                        for rank, (tn, total, top3) in enumerate(proj, 1):
+                            medal = rank_labels[rank-1] if rank <= 3 else f"#{rank}"
+                            # A toggle rather than an expander: a collapsed expander still runs (and ships) its body
+                            if st.toggle(f"{medal} {tn} — {fmt_money(total)} projected", key=f"live_open_{tn}"):
+                                rows = []
+                                top3_names = {t[0] for t in top3}
+                                for g in sorted_rosters[tn]:
+                                    p = espn_by_name.get(g)
+                                    in_top3 = g in top3_names
+                                    if p:
+                                        espn_st = p.get("espn_status", "")
+                                        if espn_st == "cut": disp, prize = "✂️ CUT", 0
+                                        elif espn_st == "wd": disp, prize = "🚫 WD/DQ", 0
+                                        else:
+                                            disp = "🏌️ Playing"
+                                            prize = pos_prize[int(p["position"])]
+                                        rows.append({"Golfer": g, "Pos": p["position_display"], "Score": p["score"], "Thru": p["thru"], "Status": disp, "Proj. Prize": prize, "Counts": "✅" if in_top3 else ""})
                                     else:
-                                        disp = "🏌️ Playing"
-                                        _pay = {int(k): v for k, v in st.session_state.live_payout.items()}
-                                        prize = compute_tied_prize(int(p["position"]), _pay, st.session_state.live_players)
-                                    rows.append({"Golfer": g, "Pos": p["position_display"], "Score": p["score"], "Thru": p["thru"], "Status": disp, "Proj. Prize": prize, "Counts": "✅" if in_top3 else ""})
-                                else:
-                                    rows.append({"Golfer": g, "Pos": "—", "Score": "—", "Thru": "—", "Status": "Not in field", "Proj. Prize": 0, "Counts": ""})
-                            st.dataframe(pd.DataFrame(rows).style.format({"Proj. Prize": fmt_money}), width="stretch", hide_index=True)
-                    st.markdown("---")
-                    st.subheader("Season If Tournament Ended Now")
-                    base = compute_standings(data)
-                    combined = sorted([{"Team": tn, "Season So Far": base.get(tn, {}).get("total", 0), "This Event (proj)": pt, "Total": base.get(tn, {}).get("total", 0) + pt} for tn, pt, _ in proj], key=lambda x: x["Total"], reverse=True)
-                    for i, row in enumerate(combined):
-                        row["Rank"] = rank_labels[i] if i < 3 else f"#{i+1}"
-                    st.dataframe(pd.DataFrame(combined)[["Rank","Team","Season So Far","This Event (proj)","Total"]].style.format({c: fmt_money for c in ["Season So Far","This Event (proj)","Total"]}), width="stretch", hide_index=True)
-            with tab2:
-                all_team_golfers = set(g for gs in data["teams"].values() for g in gs)
-
-                # ── Payout diagnostic ──────────────────────────────────────
-                payout = {int(k): v for k, v in st.session_state.live_payout.items()} if st.session_state.live_payout else {}
-                if payout:
-                    min_pos, max_pos = min(payout), max(payout)
-                    n_paying = len(payout)
-                    st.caption(f"💰 Payout loaded — covers {n_paying} positions (#{min_pos}–#{max_pos}), winner earns {fmt_money(payout.get(1,0))}")
-                else:
-                    st.warning("No payout table loaded — proj. prizes will show $0. Go to Step 1 above to load the purse breakdown.")
-
-                # Build player→team lookup once
-                player_team = {g: t for t, gs in data["teams"].items() for g in gs}
-
-                lb_rows = []
-                for p in st.session_state.live_players:
-                    espn_st = p.get("espn_status", "")
-                    pos_int = int(p["position"]) if p["position"] != 999 else 999
-                    if espn_st == "cut": sd, prize = "✂️ CUT", 0
-                    elif espn_st == "wd": sd, prize = "🚫 WD/DQ", 0
-                    elif pos_int == 999: sd, prize = "🏌️", 0
+                                        rows.append({"Golfer": g, "Pos": "—", "Score": "—", "Thru": "—", "Status": "Not in field", "Proj. Prize": 0, "Counts": ""})
+                                st.dataframe(pd.DataFrame(rows), column_config=money_columns(["Proj. Prize"]), width="stretch", hide_index=True)
+                        st.markdown("---")
+                        st.subheader("Season If Tournament Ended Now")
+                        base = cached_season(data, st.session_state.data_version)[0]
+                        cdf = pd.DataFrame({"Team": [tn for tn, _, _ in proj],
+                                            "Season So Far": [base.get(tn, {}).get("total", 0) for tn, _, _ in proj],
+                                            "This Event (proj)": [pt for _, pt, _ in proj]})
+                        cdf["Total"] = cdf["Season So Far"] + cdf["This Event (proj)"]
+                        cdf = cdf.sort_values("Total", ascending=False, kind="stable", ignore_index=True)
+                        cdf.insert(0, "Rank", [rank_labels[i] if i < 3 else f"#{i+1}" for i in range(len(cdf))])
+                        st.dataframe(cdf, column_config=money_columns(["Season So Far","This Event (proj)","Total"]), width="stretch", hide_index=True)
+                with tab2:
+                    # ── Payout diagnostic ──────────────────────────────────────
+                    if payout:
+                        min_pos, max_pos = min(payout), max(payout)
+                        n_paying = len(payout)
+                        st.caption(f"💰 Payout loaded — covers {n_paying} positions (#{min_pos}–#{max_pos}), winner earns {fmt_money(payout.get(1,0))}")
                     else:
-                        sd = "🏌️"
-                        prize = compute_tied_prize(pos_int, payout, st.session_state.live_players)
-                    team_name = player_team.get(p["name"], "")
-                    lb_rows.append({"Pos": p["position_display"], "Player": p["name"], "Team": team_name, "Score": p["score"], "Thru": p["thru"], "Status": sd, "Proj. Prize": prize})
-                st.dataframe(pd.DataFrame(lb_rows).style.format({"Proj. Prize": fmt_money}), width="stretch", hide_index=True)
-
-                # Show diagnostic if all prizes are 0 but there are active players
-                active_with_prize = sum(1 for r in lb_rows if r["Proj. Prize"] > 0)
-                active_playing = sum(1 for r in lb_rows if r["Status"] == "🏌️")
-                if payout and active_playing > 0 and active_with_prize == 0:
-                    with st.expander("⚠️ All prizes showing $0 — diagnostic info"):
-                        espn_positions = sorted(set(int(p["position"]) for p in st.session_state.live_players if p["position"] != 999))
-                        payout_positions = sorted(payout.keys())
-                        st.markdown(f"**ESPN positions returned:** {espn_positions[:20]}")
-                        st.markdown(f"**Payout table positions:** {payout_positions[:20]}")
-                        overlap = [p for p in espn_positions if p in payout]
-                        st.markdown(f"**Matching positions:** {overlap}")
-                        if not overlap:
-                            st.error("No overlap between ESPN positions and payout table! The payout URL may be wrong or the article format wasn't parsed correctly. Try reloading the payout table in Step 1.")
+                        st.warning("No payout table loaded — proj. prizes will show $0. Go to Step 1 above to load the purse breakdown.")
+
+                    lb = pd.DataFrame(st.session_state.live_players)
+                    espn_st = lb["espn_status"].fillna("")
+                    lb["Status"] = np.select([espn_st == "cut", espn_st == "wd"], ["✂️ CUT", "🚫 WD/DQ"], "🏌️")
+                    lb["Proj. Prize"] = lb["position"].astype(int).map(pos_prize).where(~espn_st.isin(["cut", "wd"]), 0)
+                    lb["Team"] = lb["name"].map(golfer_to_team).fillna("")
+                    lb = lb.rename(columns={"position_display": "Pos", "name": "Player", "score": "Score", "thru": "Thru"})
+                    # Explicit dtypes for the Arrow payload: a handful of Team/Status values ship dictionary-encoded
+                    lb = lb.astype({"Pos": "string", "Player": "string", "Score": "string", "Thru": "string",
+                                    "Team": "category", "Status": "category", "Proj. Prize": "float64"})
+                    st.dataframe(lb[["Pos", "Player", "Team", "Score", "Thru", "Status", "Proj. Prize"]],
+                                 column_config=money_columns(["Proj. Prize"]), width="stretch", hide_index=True)
+
+                    # Show diagnostic if all prizes are 0 but there are active players
+                    active_with_prize = int((lb["Proj. Prize"] > 0).sum())
+                    active_playing = int((lb["Status"] == "🏌️").sum())
+                    if payout and active_playing > 0 and active_with_prize == 0:
+                        with st.expander("⚠️ All prizes showing $0 — diagnostic info"):
+                            espn_positions = sorted(set(int(p["position"]) for p in st.session_state.live_players if p["position"] != 999))
+                            payout_positions = sorted(payout.keys())
+                            st.markdown(f"**ESPN positions returned:** {espn_positions[:20]}")
+                            st.markdown(f"**Payout table positions:** {payout_positions[:20]}")
+                            overlap = [p for p in espn_positions if p in payout]
+                            st.markdown(f"**Matching positions:** {overlap}")
+                            if not overlap:
+                                st.error("No overlap between ESPN positions and payout table! The payout URL may be wrong or the article format wasn't parsed correctly. Try reloading the payout table in Step 1.")
+        live_tracking()
 
 # ─────────────────────────────────────────────
 # PAGE: STANDINGS
@@ -1091,7 +1595,7 @@ elif page == "🏆 Standings":
         st.info("No teams set up yet. Go to ⚙️ Setup.")
         st.stop()
 
-    standings = compute_standings(data)
+    standings, history = cached_season(data, st.session_state.data_version)
     sorted_teams = sorted(standings.items(), key=lambda x: x[1]["total"], reverse=True)
     rank_labels = ["🥇", "🥈", "🥉"]
 
@@ -1104,109 +1608,43 @@ elif page == "🏆 Standings":
     st.markdown("---")
     st.subheader("Full Standings Table")
     ordered_cols = get_ordered_tournaments(data)
-    rows = []
+    leader_total = sorted_teams[0][1]["total"] if sorted_teams else 0
+    # One pass feeds both the standings table and the gap-to-leader table
+    rows, gap_rows = [], []
     for rank, (tn, info) in enumerate(sorted_teams, 1):
         row = {"Rank": rank, "Team": tn, "Total Earnings": info["total"]}
         for t_name in ordered_cols:
             row[t_name] = info["tournaments"].get(t_name, {}).get("total", 0)
         rows.append(row)
+        gap_rows.append({"Rank": rank, "Team": tn, "Total": fmt_money(info["total"]),
+                         "Gap to Leader": "LEADER" if info["total"] == leader_total else f"-{fmt_money(leader_total - info['total'])}"})
     if rows:
         df = pd.DataFrame(rows)
         money_cols = [c for c in df.columns if c not in ["Rank", "Team"]]
-        st.dataframe(df.style.format({c: fmt_money for c in money_cols}), width="stretch", hide_index=True)
+        st.dataframe(df, column_config=money_columns(money_cols), width="stretch", hide_index=True)
 
     if len(sorted_teams) > 1:
         st.markdown("---")
         st.subheader("Gap to Leader")
-        leader_total = sorted_teams[0][1]["total"]
-        gap_rows = [{"Rank": rank, "Team": team, "Total": fmt_money(info["total"]),
-                     "Gap to Leader": "LEADER" if info["total"] == leader_total else f"-{fmt_money(leader_total - info['total'])}"}
-                    for rank, (team, info) in enumerate(sorted_teams, 1)]
         st.dataframe(pd.DataFrame(gap_rows), width="stretch", hide_index=True)
 
     # ── Earnings Over Time Chart ──────────────────────────────────────────────
-    ordered_t = get_ordered_tournaments(data)
-    if len(ordered_t) >= 1 and len(data["teams"]) >= 2:
+    if len(ordered_cols) >= 1 and len(data["teams"]) >= 2:
         st.markdown("---")
         st.subheader("📈 Cumulative Prize Money Over Time")
         st.caption("Each line shows a team's running total prize money. Hover for details.")
 
-        history = compute_earnings_history(data)
         teams_by_earnings = [t for t, _ in sorted_teams]
-        colors = ["#2d6a2d", "#e07b2a", "#1a6fa8", "#a82828", "#7b3fa8", "#a8963f", "#2a9d8f", "#e63946", "#457b9d", "#f4a261"]
-        color_map = {t: colors[i % len(colors)] for i, t in enumerate(teams_by_earnings)}
 
-        try:
-            import plotly.graph_objects as go
-
-            fig = go.Figure()
-            for team_name in teams_by_earnings:
-                events = history[team_name]
-                t_labels = [e["tournament"] for e in events]
-                earnings_vals = [e["cumulative"] for e in events]
-                ranks = [e["rank"] for e in events]
-                final_earnings = earnings_vals[-1] if earnings_vals else 0
-                final_rank = ranks[-1] if ranks else 0
-
-                fig.add_trace(go.Scatter(
-                    x=t_labels,
-                    y=earnings_vals,
-                    mode="lines+markers+text",
-                    name=f"{team_name}",
-                    line=dict(color=color_map[team_name], width=3),
-                    marker=dict(size=10, color=color_map[team_name]),
-                    # Rank + name label at the end of each line
-                    text=[""] * (len(t_labels) - 1) + [f"  #{final_rank} {team_name}"],
-                    textposition="middle right",
-                    textfont=dict(color=color_map[team_name], size=12, family="Arial Black"),
-                    hovertext=[
-                        f"<b>{team_name}</b><br>After: {t}<br>Total: {fmt_money(e)}<br>Rank: #{r}"
-                        for t, e, r in zip(t_labels, earnings_vals, ranks)
-                    ],
-                    hoverinfo="text",
-                ))
-
-            fig.update_layout(
-                xaxis=dict(
-                    title=dict(text="Tournament", font=dict(size=13)),
-                    tickfont=dict(size=12),
-                    showgrid=True,
-                    gridcolor="#e0ece0",
-                ),
-                yaxis=dict(
-                    title=dict(text="Cumulative Prize Money (USD)", font=dict(size=13)),
-                    tickprefix="$",
-                    tickformat=",.0f",
-                    tickfont=dict(size=11),
-                    rangemode="tozero",
-                    showgrid=True,
-                    gridcolor="#e0ece0",
-                ),
-                # Legend on right side, ordered by current earnings (top to bottom)
-                legend=dict(
-                    title=dict(text="Team", font=dict(size=12)),
-                    orientation="v",
-                    yanchor="top", y=1,
-                    xanchor="left", x=1.02,
-                    font=dict(size=11),
-                    traceorder="normal",
-                ),
-                height=500,
-                # Extra right margin for end-of-line team labels
-                margin=dict(l=70, r=200, t=30, b=60),
-                plot_bgcolor="#f8fdf6",
-                paper_bgcolor="#ffffff",
-                hovermode="x unified",
-            )
+        if HAS_PLOTLY:
+            fig = earnings_chart(history, teams_by_earnings, st.session_state.data_version)
             st.plotly_chart(fig, width='stretch')
-
-        except ImportError:
+        else:
             st.info("Install plotly: `uv add plotly`")
-            pivot = pd.DataFrame([
-                {"Tournament": e["tournament"], "Team": tn, "Earnings": e["cumulative"]}
-                for tn, evs in history.items() for e in evs
-            ]).pivot(index="Tournament", columns="Team", values="Earnings")
-            st.dataframe(pivot.style.format(fmt_money), width="stretch")
+            # Wide straight away: one column of cumulative totals per team, rows in season order
+            pivot = pd.DataFrame({tn: [e["cumulative"] for e in history[tn]] for tn in teams_by_earnings},
+                                 index=pd.Index(ordered_cols, name="Tournament")).rename_axis(columns="Team")
+            st.dataframe(pivot, column_config=money_columns(pivot.columns), width="stretch")
 
 # ─────────────────────────────────────────────
 # PAGE: TOURNAMENTS
@@ -1218,203 +1656,186 @@ elif page == "🗓️ Tournaments":
     if not data["tournaments"]:
         st.info("No tournament results yet.")
     else:
-        standings = compute_standings(data)
-        selected_t = st.selectbox("Select Tournament", get_ordered_tournaments(data))
-        if selected_t:
-            results = data["tournaments"][selected_t].get("results", {})
-            st.subheader(selected_t)
-            sorted_teams_t = sorted(data["teams"].items(),
-                                    key=lambda x: standings[x[0]]["tournaments"].get(selected_t, {}).get("total", 0), reverse=True)
-            rank_labels = ["🥇", "🥈", "🥉"]
-            team_cols = st.columns(min(len(data["teams"]), 3))
-            for i, (tn, _) in enumerate(sorted_teams_t):
-                t_data = standings[tn]["tournaments"].get(selected_t, {})
-                medal = rank_labels[i] if i < 3 else f"#{i+1}"
-                with team_cols[i % 3]:
-                    st.markdown(f"**{medal} {tn}** — {fmt_money(t_data.get('total', 0))}")
-                    for g, m in t_data.get("top3", []):
-                        st.markdown(f"&nbsp;&nbsp;💰 {g}: {fmt_money(m)}")
-                    if not t_data.get("top3"):
-                        st.caption("No scoring golfers")
-                    st.markdown("---")
-
-            all_golfers_in_league = sorted(set(g for gs in data["teams"].values() for g in gs))
-
-            # Classify unknown_absent players (admins only)
-            if st.session_state.is_admin:
-                missing = [g for g in all_golfers_in_league if g not in results]
-                if missing:
-                    st.warning(f"{len(missing)} golfer(s) missing from results: " + ", ".join(missing[:8]) + (" ..." if len(missing) > 8 else ""))
-                    if st.button(f"🔄 Recalculate '{selected_t}'", type="primary"):
-                        for g in missing:
-                            results[g] = {"prize": 0, "status": "not_entered"}
-                        data["tournaments"][selected_t]["results"] = results
-                        save_data(data)
-                        st.success(f"Updated!")
-                        st.rerun()
-
-                league_set = set(all_golfers_in_league)
-                unknowns = [g for g, v in results.items()
-                            if isinstance(v, dict) and v.get("status") == "unknown_absent" and g in league_set]
-                if unknowns:
-                    st.markdown("---")
-                    st.subheader("❓ Classify Missing Players")
-                    st.markdown(
-                        f"**{len(unknowns)} player(s)** weren't found in the payout article — "
-                        "they could have missed the cut, withdrawn, or not been in the field. "
-                        "You can auto-classify by linking the tournament leaderboard, or set each one manually below."
-                    )
+        @st.fragment
+        def tournament_detail():
+            """Selected tournament's results and the unknown-player review; its widgets rerun only this block."""
+            standings = cached_season(data, st.session_state.data_version)[0]
+            selected_t = st.selectbox("Select Tournament", get_ordered_tournaments(data))
+            if selected_t:
+                results = data["tournaments"][selected_t].get("results", {})
+                st.subheader(selected_t)
+                t_data_by_team = {tn: standings[tn]["tournaments"].get(selected_t, {}) for tn in data["teams"]}
+                sorted_teams_t = sorted(t_data_by_team.items(), key=lambda x: x[1].get("total", 0), reverse=True)
+                rank_labels = ["🥇", "🥈", "🥉"]
+                team_cols = st.columns(min(len(data["teams"]), 3))
+                for i, (tn, t_data) in enumerate(sorted_teams_t):
+                    medal = rank_labels[i] if i < 3 else f"#{i+1}"
+                    with team_cols[i % 3]:
+                        st.markdown(f"**{medal} {tn}** — {fmt_money(t_data.get('total', 0))}")
+                        for g, m in t_data.get("top3", []):
+                            st.markdown(f"&nbsp;&nbsp;💰 {g}: {fmt_money(m)}")
+                        if not t_data.get("top3"):
+                            st.caption("No scoring golfers")
+                        st.markdown("---")
+
+                all_golfers_in_league = league_golfers
+
+                # Classify unknown_absent players (admins only)
+                if st.session_state.is_admin:
+                    missing = [g for g in all_golfers_in_league if g not in results]
+                    if missing:
+                        st.warning(f"{len(missing)} golfer(s) missing from results: " + ", ".join(missing[:8]) + (" ..." if len(missing) > 8 else ""))
+                        if st.button(f"🔄 Recalculate '{selected_t}'", type="primary"):
+                            for g in missing:
+                                results[g] = {"prize": 0, "status": "not_entered"}
+                            data["tournaments"][selected_t]["results"] = results
+                            save_data(data)
+                            st.success(f"Updated!")
+                            st.rerun()
 
-                    # ── Auto-classify via leaderboard URL ─────────────────
-                    with st.expander("🔗 Auto-classify using PGA Tour leaderboard (recommended)"):
+                    unknowns = unknown_golfers(data, st.session_state.data_version, selected_t)
+                    if unknowns:
+                        st.markdown("---")
+                        st.subheader("❓ Classify Missing Players")
                         st.markdown(
-                            "Paste the tournament leaderboard URL. It shows everyone who played "
-                            "and their status (CUT, WD, etc.).\n\n"
-                            "Format: `pgatour.com/tournaments/2026/{tournament-name}/{event-id}/leaderboard`"
+                            f"**{len(unknowns)} player(s)** weren't found in the payout article — "
+                            "they could have missed the cut, withdrawn, or not been in the field. "
+                            "You can auto-classify by linking the tournament leaderboard, or set each one manually below."
                         )
-                        lb_url_col, lb_btn_col = st.columns([4, 1])
-                        with lb_url_col:
-                            lb_url = st.text_input(
-                                "Leaderboard URL", key=f"lb_url_{selected_t}",
-                                label_visibility="collapsed",
-                                placeholder="https://www.pgatour.com/tournaments/2026/the-american-express/R2026002/leaderboard"
-                            )
-                        with lb_btn_col:
-                            auto_classify = st.button("Auto-classify", type="primary", key=f"lb_auto_{selected_t}")
 
-                        if auto_classify and lb_url:
-                            with st.spinner("Scraping leaderboard..."):
-                                try:
-                                    tid = _extract_tournament_id(lb_url)
-                                    lb_status = scrape_pga_leaderboard_status(lb_url)
-                                    if not lb_status:
-                                        st.error(
-                                            f"Couldn't extract player statuses. "
-                                            + (f"Tournament ID found: **{tid}**. " if tid else "**No tournament ID found in URL** (expected format: .../R2026002/leaderboard). ")
-                                            + "Try the exact URL from the leaderboard page, e.g. `pgatour.com/tournaments/2026/the-american-express/R2026002/leaderboard`"
-                                        )
-                                    else:
+                        # ── Auto-classify via leaderboard URL ─────────────────
+                        with st.expander("🔗 Auto-classify using PGA Tour leaderboard (recommended)"):
+                            st.markdown(
+                                "Paste the tournament leaderboard URL. It shows everyone who played "
+                                "and their status (CUT, WD, etc.).\n\n"
+                                "Format: `pgatour.com/tournaments/2026/{tournament-name}/{event-id}/leaderboard`"
+                            )
+                            lb_url_col, lb_btn_col = st.columns([4, 1])
+                            with lb_url_col:
+                                lb_url = st.text_input(
+                                    "Leaderboard URL", key=f"lb_url_{selected_t}",
+                                    label_visibility="collapsed",
+                                    placeholder="https://www.pgatour.com/tournaments/2026/the-american-express/R2026002/leaderboard"
+                                )
+                            with lb_btn_col:
+                                auto_classify = st.button("Auto-classify", type="primary", key=f"lb_auto_{selected_t}")
+                            lb_fresh = st.checkbox("Force refresh", key=f"lb_fresh_{selected_t}",
+                                                   help="Re-fetch the leaderboard instead of reusing this URL's scrape "
+                                                        "or cached HTTP responses from the last 10 minutes")
+
+                            if auto_classify and lb_url:
+                                with st.spinner("Scraping leaderboard..."):
+                                    try:
+                                        if lb_fresh:
+                                            scrape_pga_leaderboard_status.clear(lb_url)
+                                        lb_status = scrape_pga_leaderboard_status(lb_url, _fresh=lb_fresh)
                                         updated_results = apply_leaderboard_status(dict(results), lb_status)
                                         data["tournaments"][selected_t]["results"] = updated_results
                                         save_data(data)
                                         # Count outcomes
-                                        newly_cut = sum(1 for g in unknowns if updated_results.get(g, {}).get("status") == "cut")
-                                        newly_wd = sum(1 for g in unknowns if updated_results.get(g, {}).get("status") == "wd")
-                                        newly_dnp = sum(1 for g in unknowns if updated_results.get(g, {}).get("status") == "not_entered")
-                                        still_unk = sum(1 for g in unknowns if updated_results.get(g, {}).get("status") == "unknown_absent")
+                                        outcome = Counter(updated_results[g]["status"] for g in unknowns)
+                                        newly_cut, newly_wd = outcome["cut"], outcome["wd"]
+                                        newly_dnp, still_unk = outcome["not_entered"], outcome["unknown_absent"]
                                         st.success(
                                             f"Auto-classified {len(unknowns) - still_unk} players: "
                                             f"{newly_cut} cut · {newly_wd} WD/DQ · {newly_dnp} not entered"
                                             + (f" · {still_unk} still unknown" if still_unk else "")
                                         )
                                         st.rerun()
-                                except Exception as e:
-                                    st.error(f"Failed to scrape leaderboard: {e}")
-
-                    # ── Manual classification form ─────────────────────────
-                    # Re-fetch unknowns in case auto-classify resolved some
-                    remaining_unknowns = [g for g, v in results.items()
-                                          if isinstance(v, dict) and v.get("status") == "unknown_absent" and g in league_set]
-                    if remaining_unknowns:
-                        st.markdown("**Manual classification:**")
-                        with st.form(f"classify_{selected_t}"):
-                            updates = {}
-                            for i in range(0, len(remaining_unknowns), 3):
-                                rcols = st.columns(3)
-                                for j, golfer in enumerate(remaining_unknowns[i:i+3]):
-                                    team = next((t for t, gs in data["teams"].items() if golfer in gs), "?")
-                                    with rcols[j]:
-                                        st.markdown(f"**{golfer}**  \n_{team}_")
-                                        updates[golfer] = st.selectbox(
-                                            golfer,
-                                            ["cut", "not_entered", "wd"],
-                                            key=f"cls_{selected_t}_{golfer}",
-                                            label_visibility="collapsed",
-                                            help="cut = was in field but missed cut | not_entered = wasn't in field | wd = withdrew or DQ'd"
-                                        )
-                            if st.form_submit_button("✅ Save Manual Classifications", type="primary"):
-                                for golfer, status in updates.items():
-                                    results[golfer]["status"] = status
-                                data["tournaments"][selected_t]["results"] = results
-                                save_data(data)
-                                st.success("Saved!")
-                                st.rerun()
+                                    except Exception as e:
+                                        st.error(f"Failed to scrape leaderboard: {e}")
+
+                        # ── Manual classification form ─────────────────────────
+                        # Re-check unknowns in case auto-classify resolved some (it updates the entries in place)
+                        remaining_unknowns = [g for g in unknowns if results[g]["status"] == "unknown_absent"]
+                        if remaining_unknowns:
+                            st.markdown("**Manual classification:**")
+                            with st.form(f"classify_{selected_t}"):
+                                updates = classify_editor(remaining_unknowns, golfer_to_team)
+                                if st.form_submit_button("✅ Save Manual Classifications", type="primary"):
+                                    for golfer, status in updates.items():
+                                        results[golfer]["status"] = status
+                                    data["tournaments"][selected_t]["results"] = results
+                                    save_data(data)
+                                    st.success("Saved!")
+                                    st.rerun()
 
-            if results:
-                st.markdown("---")
-                st.subheader("All Golfer Results")
+                if results:
+                    st.markdown("---")
+                    st.subheader("All Golfer Results")
 
-                # Split into scoring (prize > 0) and non-scoring ($0) players
-                scoring = sorted(
-                    [g for g in all_golfers_in_league if get_prize(results.get(g, {})) > 0],
-                    key=lambda g: get_prize(results.get(g, {})), reverse=True
-                )
-                non_scoring = [g for g in all_golfers_in_league if get_prize(results.get(g, {})) == 0]
-
-                # Scoring players — read-only table
-                if scoring:
-                    score_rows = [{
-                        "Golfer": g,
-                        "Team": next((t for t, gs in data["teams"].items() if g in gs), "?"),
-                        "Status": STATUS_EMOJI.get(get_status(results.get(g, {})), ""),
-                        "Prize": get_prize(results.get(g, {})),
-                    } for g in scoring]
-                    st.dataframe(
-                        pd.DataFrame(score_rows).style.format({"Prize": fmt_money}),
-                        width="stretch", hide_index=True
+                    # Split into scoring (prize > 0) and non-scoring ($0) players
+                    scoring = sorted(
+                        [g for g in all_golfers_in_league if results.get(g, NO_RESULT)["prize"] > 0],
+                        key=lambda g: results.get(g, NO_RESULT)["prize"], reverse=True
                     )
+                    non_scoring = [g for g in all_golfers_in_league if results.get(g, NO_RESULT)["prize"] == 0]
 
-                # $0 players — inline editable status (admin) or read-only (non-admin)
-                if non_scoring:
-                    st.markdown(f"**$0 players ({len(non_scoring)})** — " +
-                                ("change any status that's wrong and hit Save." if st.session_state.is_admin else ""))
-
-                    STATUS_OPTIONS = ["cut", "wd", "not_entered", "unknown_absent"]
-                    STATUS_LABELS  = {"cut": "✂️ Cut", "wd": "🚫 WD/DQ",
-                                      "not_entered": "— Not entered", "unknown_absent": "❓ Unknown"}
-
-                    if st.session_state.is_admin:
-                        with st.form(f"inline_status_{selected_t}"):
-                            updated_statuses = {}
-                            cols_per_row = 3
-                            for i in range(0, len(non_scoring), cols_per_row):
-                                row_cols = st.columns(cols_per_row)
-                                for j, g in enumerate(non_scoring[i:i + cols_per_row]):
-                                    team = next((t for t, gs in data["teams"].items() if g in gs), "?")
-                                    cur = get_status(results.get(g, {}))
-                                    cur_idx = STATUS_OPTIONS.index(cur) if cur in STATUS_OPTIONS else 0
-                                    with row_cols[j]:
-                                        st.markdown(f"**{g}** · _{team}_")
-                                        updated_statuses[g] = st.selectbox(
-                                            g, STATUS_OPTIONS,
-                                            index=cur_idx,
-                                            format_func=lambda s: STATUS_LABELS.get(s, s),
-                                            key=f"inline_{selected_t}_{g}",
-                                            label_visibility="collapsed",
-                                        )
-                            if st.form_submit_button("💾 Save status changes", type="primary"):
-                                changed = 0
-                                for g, new_status in updated_statuses.items():
-                                    old_status = get_status(results.get(g, {}))
-                                    if new_status != old_status:
-                                        results[g] = {"prize": 0, "status": new_status}
-                                        changed += 1
-                                if changed:
-                                    data["tournaments"][selected_t]["results"] = results
-                                    save_data(data)
-                                    st.success(f"Saved {changed} change(s).")
-                                    st.rerun()
-                                else:
-                                    st.info("No changes to save.")
-                    else:
-                        # Read-only view for non-admins
-                        ro_rows = [{
+                    # Scoring players — read-only table
+                    if scoring:
+                        score_rows = [{
                             "Golfer": g,
-                            "Team": next((t for t, gs in data["teams"].items() if g in gs), "?"),
-                            "Status": STATUS_LABELS.get(get_status(results.get(g, {})),
-                                                        get_status(results.get(g, {}))),
-                        } for g in non_scoring]
-                        st.dataframe(pd.DataFrame(ro_rows), width="stretch", hide_index=True)
+                            "Team": golfer_to_team.get(g, "?"),
+                            "Status": STATUS_EMOJI.get(results.get(g, NO_RESULT)["status"], ""),
+                            "Prize": results.get(g, NO_RESULT)["prize"],
+                        } for g in scoring]
+                        st.dataframe(
+                            pd.DataFrame(score_rows), column_config=money_columns(["Prize"]),
+                            width="stretch", hide_index=True
+                        )
+
+                    # $0 players — inline editable status (admin) or read-only (non-admin)
+                    if non_scoring:
+                        st.markdown(f"**$0 players ({len(non_scoring)})** — " +
+                                    ("change any status that's wrong and hit Save." if st.session_state.is_admin else ""))
+
+                        STATUS_OPTIONS = ["cut", "wd", "not_entered", "unknown_absent"]
+                        STATUS_LABELS  = {"cut": "✂️ Cut", "wd": "🚫 WD/DQ",
+                                          "not_entered": "— Not entered", "unknown_absent": "❓ Unknown"}
+
+                        if st.session_state.is_admin:
+                            with st.form(f"inline_status_{selected_t}"):
+                                updated_statuses = {}
+                                cols_per_row = 3
+                                for i in range(0, len(non_scoring), cols_per_row):
+                                    row_cols = st.columns(cols_per_row)
+                                    for j, g in enumerate(non_scoring[i:i + cols_per_row]):
+                                        team = golfer_to_team.get(g, "?")
+                                        cur = results.get(g, NO_RESULT)["status"]
+                                        cur_idx = STATUS_OPTIONS.index(cur) if cur in STATUS_OPTIONS else 0
+                                        with row_cols[j]:
+                                            st.markdown(f"**{g}** · _{team}_")
+                                            updated_statuses[g] = st.selectbox(
+                                                g, STATUS_OPTIONS,
+                                                index=cur_idx,
+                                                format_func=lambda s: STATUS_LABELS.get(s, s),
+                                                key=f"inline_{selected_t}_{g}",
+                                                label_visibility="collapsed",
+                                            )
+                                if st.form_submit_button("💾 Save status changes", type="primary"):
+                                    changed = 0
+                                    for g, new_status in updated_statuses.items():
+                                        old_status = results.get(g, NO_RESULT)["status"]
+                                        if new_status != old_status:
+                                            results[g] = {"prize": 0, "status": new_status}
+                                            changed += 1
+                                    if changed:
+                                        data["tournaments"][selected_t]["results"] = results
+                                        save_data(data)
+                                        st.success(f"Saved {changed} change(s).")
+                                        st.rerun()
+                                    else:
+                                        st.info("No changes to save.")
+                        else:
+                            # Read-only view for non-admins
+                            ro_rows = [{
+                                "Golfer": g,
+                                "Team": golfer_to_team.get(g, "?"),
+                                "Status": STATUS_LABELS.get(results.get(g, NO_RESULT)["status"],
+                                                            results.get(g, NO_RESULT)["status"]),
+                            } for g in non_scoring]
+                            st.dataframe(pd.DataFrame(ro_rows), width="stretch", hide_index=True)
+        tournament_detail()
 
 
 elif page == "👥 Teams":
@@ -1422,20 +1843,19 @@ elif page == "👥 Teams":
     if not data["teams"]:
         st.info("No teams yet. Go to ⚙️ Setup.")
         st.stop()
-    standings = compute_standings(data)
+    standings = cached_season(data, st.session_state.data_version)[0]
     sorted_teams = sorted(standings.items(), key=lambda x: x[1]["total"], reverse=True)
+    rank_by_team = {t: i for i, (t, _) in enumerate(sorted_teams, 1)}
     selected_team = st.selectbox("Select Team", [t[0] for t in sorted_teams])
     if selected_team:
         team_info = standings[selected_team]
-        golfers = data["teams"][selected_team]
-        rank = next(i+1 for i, (t, _) in enumerate(sorted_teams) if t == selected_team)
+        rank = rank_by_team[selected_team]
         rank_labels = {1: "🥇", 2: "🥈", 3: "🥉"}
         col1, col2 = st.columns([1, 2])
         with col1:
             st.markdown(f'<div class="metric-card"><div style="font-size:1rem;color:#555;">Season Rank</div><div class="big-number">{rank_labels.get(rank, f"#{rank}")}</div></div><div class="metric-card"><div style="font-size:1rem;color:#555;">Total Earnings</div><div class="big-number">{fmt_money(team_info["total"])}</div></div>', unsafe_allow_html=True)
             st.markdown("**Drafted Golfers:**")
-            for g in sorted(golfers):
-                st.markdown(f"• {g}")
+            st.markdown("  \n".join(f"• {g}" for g in sorted_rosters[selected_team]))
         with col2:
             st.subheader("Tournament Breakdown")
             t_rows = []
@@ -1446,22 +1866,11 @@ elif page == "👥 Teams":
                 top3 = t_data.get("top3", [])
                 t_rows.append({"Tournament": t_name, "Top 3 Total": t_data["total"], "Scoring Golfers": ", ".join(f"{g} ({fmt_money(m)})" for g, m in top3) if top3 else "—"})
             if t_rows:
-                st.dataframe(pd.DataFrame(t_rows).style.format({"Top 3 Total": fmt_money}), width="stretch", hide_index=True)
+                st.dataframe(pd.DataFrame(t_rows), column_config=money_columns(["Top 3 Total"]), width="stretch", hide_index=True)
             st.subheader("Golfer Detail")
-            ge = defaultdict(lambda: {"cashes": 0, "cuts": 0, "wds": 0, "not_entered": 0, "total_prize": 0, "counted": 0})
-            for t_name, t_info_item in data["tournaments"].items():
-                results = t_info_item.get("results", {})
-                top3_names = {g for g, _ in team_info["tournaments"].get(t_name, {}).get("top3", [])}
-                for g in golfers:
-                    entry = results.get(g, {"prize": 0, "status": "not_entered"})
-                    prize, status = get_prize(entry), get_status(entry)
-                    if status == "cut": ge[g]["cuts"] += 1
-                    elif status == "wd": ge[g]["wds"] += 1
-                    elif status in ("not_entered", "unknown_absent"): ge[g]["not_entered"] += 1
-                    elif prize > 0: ge[g]["cashes"] += 1; ge[g]["total_prize"] += prize
-                    if g in top3_names: ge[g]["counted"] += prize
-            ge_df = pd.DataFrame([{"Golfer": g, "Cashes": ge[g]["cashes"], "Cuts": ge[g]["cuts"], "WD/DQ": ge[g]["wds"], "Not Entered": ge[g]["not_entered"], "Total Prize": ge[g]["total_prize"], "Counted for Team": ge[g]["counted"]} for g in sorted(golfers)]).sort_values("Counted for Team", ascending=False)
-            st.dataframe(ge_df.style.format({"Total Prize": fmt_money, "Counted for Team": fmt_money}), width="stretch", hide_index=True)
+            ge_df = team_golfer_stats(data, st.session_state.data_version, selected_team).reset_index()
+            ge_df = ge_df.sort_values("Counted for Team", ascending=False)
+            st.dataframe(ge_df, column_config=money_columns(["Total Prize", "Counted for Team"]), width="stretch", hide_index=True)
 
 # ─────────────────────────────────────────────
 # PAGE: PLAYER STATS
@@ -1476,48 +1885,34 @@ elif page == "📊 Player Stats":
     tab_owned, tab_unowned = st.tabs(["👥 Rostered Players", "🆓 Best Unowned Golfers"])
 
     with tab_owned:
-        all_golfers = sorted(set(g for gs in data["teams"].values() for g in gs))
-        golfer_to_team = {g: t for t, gs in data["teams"].items() for g in gs}
-        rows = []
-        for golfer in all_golfers:
-            team = golfer_to_team.get(golfer, "?")
-            stats = {"cashes": 0, "cuts": 0, "wds": 0, "not_entered": 0, "total_prize": 0, "counted": 0}
-            for t_name, t_info in data["tournaments"].items():
-                results = t_info.get("results", {})
-                entry = results.get(golfer, {"prize": 0, "status": "not_entered"})
-                prize, status = get_prize(entry), get_status(entry)
-                if status == "cut": stats["cuts"] += 1
-                elif status == "wd": stats["wds"] += 1
-                elif status in ("not_entered", "unknown_absent"): stats["not_entered"] += 1
-                elif prize > 0: stats["cashes"] += 1; stats["total_prize"] += prize
-                _, top3 = get_team_earnings_for_tournament(data["teams"].get(team, []), results)
-                if golfer in {g2 for g2, _ in top3}: stats["counted"] += prize
-            rows.append({"Golfer": golfer, "Team": team, "Cashes": stats["cashes"], "Cuts": stats["cuts"], "WD/DQ": stats["wds"], "Not Entered": stats["not_entered"], "Total Prize": stats["total_prize"], "Counted for Team": stats["counted"]})
-        df = pd.DataFrame(rows)
+        all_golfers = league_golfers
+        standings = cached_season(data, st.session_state.data_version)[0]
+        full_df = golfer_season_stats(data, results_frame(data, st.session_state.data_version), all_golfers, golfer_to_team, standings).reset_index()
+        full_df.insert(1, "Team", full_df["Golfer"].map(golfer_to_team).fillna("?"))
+        df = full_df
         col1, col2 = st.columns(2)
         with col1:
-            team_filter = st.multiselect("Filter by Team", sorted(data["teams"].keys()))
+            team_filter = st.multiselect("Filter by Team", list(sorted_rosters))
         with col2:
             sort_col = st.selectbox("Sort By", ["Counted for Team", "Total Prize", "Cashes", "Cuts"])
         if team_filter:
             df = df[df["Team"].isin(team_filter)]
         df = df.sort_values(sort_col, ascending=False)
-        st.dataframe(df.style.format({"Total Prize": fmt_money, "Counted for Team": fmt_money}), width="stretch", hide_index=True)
+        st.dataframe(df, column_config=money_columns(["Total Prize", "Counted for Team"]), width="stretch", hide_index=True)
         if len(df) > 0:
             st.markdown("---")
             st.subheader("🌟 Top Performers")
-            full_df = pd.DataFrame(rows)
             c1, c2, c3 = st.columns(3)
             with c1:
-                top = full_df.sort_values("Counted for Team", ascending=False).iloc[0]
+                top = full_df.nlargest(1, "Counted for Team").iloc[0]
                 st.markdown("**Most Counted for Team**")
                 st.metric(top["Golfer"], fmt_money(top["Counted for Team"]), f"({top['Team']})")
             with c2:
-                top = full_df.sort_values("Total Prize", ascending=False).iloc[0]
+                top = full_df.nlargest(1, "Total Prize").iloc[0]
                 st.markdown("**Most Prize Money**")
                 st.metric(top["Golfer"], fmt_money(top["Total Prize"]), f"({top['Team']})")
             with c3:
-                top = full_df.sort_values("Cuts", ascending=False).iloc[0]
+                top = full_df.nlargest(1, "Cuts").iloc[0]
                 st.markdown("**Most Cuts**")
                 st.metric(top["Golfer"], f"{int(top['Cuts'])}", f"({top['Team']})")
 
@@ -1525,7 +1920,7 @@ elif page == "📊 Player Stats":
         st.subheader("🆓 Best Unowned Golfers This Season")
         st.caption("Golfers who appeared in tournament results but aren't on any roster, ranked by total prize money.")
 
-        unowned = get_unowned_golfer_earnings(data)
+        unowned = cached_unowned(data, st.session_state.data_version, golfer_to_team)
         if not unowned:
             st.info("No unowned golfer data yet — import some tournaments first.")
         else:
@@ -1547,17 +1942,14 @@ elif page == "📊 Player Stats":
             st.markdown("---")
             show_n = st.slider("Show top N golfers", min_value=5, max_value=min(50, len(unowned)), value=min(20, len(unowned)), step=5)
 
-            unowned_rows = []
-            for golfer, total in unowned[:show_n]:
-                row = {"Golfer": golfer, "Season Total": total}
-                for t_name in ordered_t:
-                    entry = data["tournaments"].get(t_name, {}).get("results", {}).get(golfer)
-                    row[t_name] = get_prize(entry) if entry else 0
-                unowned_rows.append(row)
-
-            unowned_df = pd.DataFrame(unowned_rows)
+            totals = pd.Series(dict(unowned[:show_n]), name="Season Total")
+            long = results_frame(data, st.session_state.data_version).reset_index()
+            wide = long[long["golfer"].isin(totals.index)].pivot_table(
+                index="golfer", columns="tournament", values="prize", aggfunc="sum", fill_value=0,
+            ).reindex(index=totals.index, columns=ordered_t, fill_value=0)
+            unowned_df = pd.concat([totals, wide], axis=1).rename_axis("Golfer").reset_index()
             money_cols = [c for c in unowned_df.columns if c != "Golfer"]
-            st.dataframe(unowned_df.style.format({c: fmt_money for c in money_cols}), width="stretch", hide_index=True)
+            st.dataframe(unowned_df, column_config=money_columns(money_cols), width="stretch", hide_index=True)
             st.caption(f"Showing {min(show_n, len(unowned))} of {len(unowned)} unowned golfers with prize money this season.")
 
 # ─────────────────────────────────────────────
@@ -1571,7 +1963,11 @@ elif page == "⚙️ Setup":
     st.title("⚙️ League Setup")
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["Add Team", "Edit Team Roster", "Tournament Order", "Manual Entry / Edit", "Import / Export"])
 
-    with tab1:
+    # Each tab reruns on its own while being edited. Saves that change teams or the tournament
+    # list still rerun the whole page with st.rerun(), since the other tabs and pages read them.
+    @st.fragment
+    def add_team_tab():
+        """New team form."""
         st.subheader("Create a New Team")
         new_team_name = st.text_input("Team / Owner Name")
         golfer_input = st.text_area("Golfers (one per line)", height=300, placeholder="Scottie Scheffler\nRory McIlroy\n...")
@@ -1586,11 +1982,13 @@ elif page == "⚙️ Setup":
                 st.rerun()
         st.info("**Name matching:** Golfer names must match ESPN exactly. Check the Full Leaderboard tab — ⭐ marks matched players.")
 
-    with tab2:
+    @st.fragment
+    def edit_team_tab():
+        """Roster editor and team delete."""
         if not data["teams"]:
             st.info("No teams yet.")
         else:
-            edit_team = st.selectbox("Select Team", sorted(data["teams"].keys()))
+            edit_team = st.selectbox("Select Team", list(sorted_rosters))
             updated = st.text_area("Golfers (one per line)", value="\n".join(data["teams"].get(edit_team, [])), height=300)
             c1, c2 = st.columns(2)
             with c1:
@@ -1605,28 +2003,35 @@ elif page == "⚙️ Setup":
                     save_data(data)
                     st.rerun()
 
-    with tab3:
+    @st.fragment
+    def tournament_order_tab():
+        """Tournament order editor."""
         st.subheader("Tournament Order")
         st.markdown("Set the order tournaments appear in standings and the chart.")
-        order = data.get("tournament_order", get_ordered_tournaments(data))
+        order = data["tournament_order"] if "tournament_order" in data else get_ordered_tournaments(data)
         if not order:
             st.info("No tournaments yet.")
         else:
-            for i, t_name in enumerate(order):
-                c1, c2, c3 = st.columns([6, 1, 1])
-                c1.markdown(f"**{i+1}.** {t_name}")
-                if i > 0 and c2.button("▲", key=f"up_{i}"):
-                    order[i-1], order[i] = order[i], order[i-1]
-                    data["tournament_order"] = order
-                    save_data(data)
-                    st.rerun()
-                if i < len(order)-1 and c3.button("▼", key=f"dn_{i}"):
-                    order[i], order[i+1] = order[i+1], order[i]
-                    data["tournament_order"] = order
-                    save_data(data)
-                    st.rerun()
+            # Renumber in one go and save once, instead of a rerun per ▲/▼ step
+            st.caption("Change the Pos numbers, then save. Equal numbers keep their current order.")
+            with st.form("tournament_order_form"):
+                edited = st.data_editor(
+                    pd.DataFrame({"Pos": range(1, len(order) + 1), "Tournament": order}),
+                    column_config={"Pos": st.column_config.NumberColumn(min_value=1, step=1)},
+                    disabled=["Tournament"], num_rows="fixed", hide_index=True, width="stretch",
+                )
+                if st.form_submit_button("💾 Save order", type="primary"):
+                    new_order = edited.sort_values("Pos", kind="stable")["Tournament"].tolist()
+                    if new_order != order:
+                        data["tournament_order"] = new_order
+                        save_data(data)
+                        st.rerun(scope="fragment")
+                    else:
+                        st.info("No changes to save.")
 
-    with tab4:
+    @st.fragment
+    def manual_entry_tab():
+        """Create, hand-edit and delete tournaments."""
         st.subheader("Manual Entry / Edit")
         st.info("💡 Use Live Leaderboard → Import to auto-populate results. Use this tab for manual corrections.")
         mode_entry = st.radio("Action", ["Create new tournament", "Edit existing tournament"],
@@ -1644,37 +2049,36 @@ elif page == "⚙️ Setup":
                 else:
                     st.warning("Already exists.")
         if data["tournaments"]:
-            edit_t = st.selectbox("Tournament to edit", get_ordered_tournaments(data), key="edit_t_setup")
+            ordered_t = get_ordered_tournaments(data)
+            edit_t = st.selectbox("Tournament to edit", ordered_t, key="edit_t_setup")
             if edit_t and data["teams"]:
-                all_golfers_me = sorted(set(g for gs in data["teams"].values() for g in gs))
+                all_golfers_me = league_golfers
                 current_results_me = data["tournaments"][edit_t].get("results", {})
-                all_statuses = ["scored", "cut", "wd", "not_entered", "unknown_absent"]
+                all_statuses = list(STATUS_CATS.categories)
+                edit_df = pd.DataFrame({"Golfer": all_golfers_me})
+                entries = [current_results_me.get(g, NOT_ENTERED) for g in all_golfers_me]
+                edit_df["Prize"] = [int(e["prize"]) for e in entries]
+                edit_df["Status"] = [e["status"] if e["status"] in all_statuses else "not_entered" for e in entries]
                 with st.form("results_form_setup"):
                     st.markdown("Enter prize money and status for each golfer.")
-                    new_results_me = {}
-                    for i in range(0, len(all_golfers_me), 3):
-                        cols = st.columns(3)
-                        for j, golfer in enumerate(all_golfers_me[i:i+3]):
-                            entry = current_results_me.get(golfer, {"prize": 0, "status": "not_entered"})
-                            cur_prize = int(get_prize(entry))
-                            cur_status = get_status(entry)
-                            safe_idx = all_statuses.index(cur_status) if cur_status in all_statuses else 3
-                            with cols[j]:
-                                st.markdown(f"**{golfer}**")
-                                prize_val = st.number_input(f"Prize ({golfer})", min_value=0, value=cur_prize,
-                                                            step=1000, key=f"prize_me_{edit_t}_{golfer}",
-                                                            label_visibility="collapsed")
-                                status_val = st.selectbox(f"Status ({golfer})", all_statuses, index=safe_idx,
-                                                          key=f"status_me_{edit_t}_{golfer}",
-                                                          label_visibility="collapsed")
-                                new_results_me[golfer] = {"prize": prize_val, "status": status_val}
+                    # One grid widget instead of a number_input + selectbox per golfer
+                    edited = st.data_editor(
+                        edit_df,
+                        column_config={
+                            "Prize": st.column_config.NumberColumn(min_value=0, step=1000, format="dollar"),
+                            "Status": st.column_config.SelectboxColumn(options=all_statuses, required=True),
+                        },
+                        disabled=["Golfer"], num_rows="fixed", hide_index=True, width="stretch",
+                    )
                     if st.form_submit_button("💾 Save Results", type="primary"):
+                        new_results_me = {g: {"prize": int(prize) if pd.notna(prize) else 0, "status": status}
+                                          for g, prize, status in zip(edited["Golfer"], edited["Prize"], edited["Status"])}
                         data["tournaments"][edit_t]["results"] = new_results_me
                         save_data(data)
                         st.success(f"Saved results for {edit_t}")
-                        st.rerun()
+                        st.rerun(scope="fragment")
             st.markdown("---")
-            del_t = st.selectbox("Delete a tournament", get_ordered_tournaments(data), key="del_t_setup")
+            del_t = st.selectbox("Delete a tournament", ordered_t, key="del_t_setup")
             if st.button("🗑️ Delete Tournament", type="secondary", key="del_t_btn"):
                 del data["tournaments"][del_t]
                 if del_t in data.get("tournament_order", []):
@@ -1683,18 +2087,38 @@ elif page == "⚙️ Setup":
                 st.success(f"Deleted {del_t}")
                 st.rerun()
 
-    with tab5:
+    @st.fragment
+    def backup_tab():
+        """Backup download and restore."""
         st.subheader("Backup & Restore")
         c1, c2 = st.columns(2)
         with c1:
-            st.download_button("⬇️ Download Backup", data=json.dumps(data, indent=2), file_name="fantasy_golf_backup.json", mime="application/json")
+            # Serialized on click, so fragment saves are included and reruns skip the dump
+            st.download_button("⬇️ Download Backup",
+                               data=lambda: orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS),
+                               file_name="fantasy_golf_backup.json", mime="application/json", on_click="ignore")
         with c2:
             uploaded = st.file_uploader("Upload backup", type="json")
             if uploaded:
-                imported = json.load(uploaded)
+                imported = normalize_results(orjson.loads(uploaded.getvalue()))
                 st.session_state.data = imported
                 save_data(imported)
                 st.success("Imported!")
                 st.rerun()
         st.markdown("---")
-        st.markdown(f"**Teams:** {len(data['teams'])} | **Golfers:** {sum(len(v) for v in data['teams'].values())} | **Tournaments:** {len(data['tournaments'])}")
\ No newline at end of file
+        st.markdown(f"**Teams:** {len(data['teams'])} | **Golfers:** {sum(len(v) for v in data['teams'].values())} | **Tournaments:** {len(data['tournaments'])}")
+
+    with tab1:
+        add_team_tab()
+
+    with tab2:
+        edit_team_tab()
+
+    with tab3:
+        tournament_order_tab()
+
+    with tab4:
+        manual_entry_tab()
+
+    with tab5:
+        backup_tab()
\ No newline at end of file